@@ -4,11 +4,9 @@ API endpoints for authentication.
 
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Header, Request, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Request, status
 
-from app.core.dependencies import require_auth
-from app.db.session import get_db
+from app.core.dependencies import get_auth_service, require_auth
 from app.schemas.auth import (
     AuthResponse,
     PasswordChange,
@@ -28,12 +26,19 @@ def get_client_info(request: Request) -> tuple[Optional[str], Optional[str]]:
     """
     Extract client information from request.
 
+    The result is cached on ``request.state`` so headers are parsed at most
+    once per request.
+
     Args:
         request: FastAPI request
 
     Returns:
         Tuple of (user_agent, ip_address)
     """
+    client_info = getattr(request.state, "client_info", None)
+    if client_info is not None:
+        return client_info
+
     user_agent = request.headers.get("user-agent")
     # Get real IP from proxy headers if behind reverse proxy
     ip_address = (
@@ -41,7 +46,10 @@ def get_client_info(request: Request) -> tuple[Optional[str], Optional[str]]:
         or request.headers.get("x-real-ip")
         or request.client.host if request.client else None
     )
-    return user_agent, ip_address
+
+    client_info = (user_agent, ip_address)
+    request.state.client_info = client_info
+    return client_info
 
 
 @router.post(
@@ -54,7 +62,7 @@ def get_client_info(request: Request) -> tuple[Optional[str], Optional[str]]:
 async def register(
     data: UserRegister,
     request: Request,
-    db: AsyncSession = Depends(get_db),
+    service: AuthService = Depends(get_auth_service),
 ) -> AuthResponse:
     """
     Register a new user.
@@ -62,12 +70,11 @@ async def register(
     Args:
         data: Registration data
         request: Request object
-        db: Database session
+        service: Auth service
 
     Returns:
         Auth response with user and tokens
     """
-    service = AuthService(db)
     user_agent, ip_address = get_client_info(request)
     return await service.register(data, user_agent, ip_address)
 
@@ -81,7 +88,7 @@ async def register(
 async def login(
     data: UserLogin,
     request: Request,
-    db: AsyncSession = Depends(get_db),
+    service: AuthService = Depends(get_auth_service),
 ) -> AuthResponse:
     """
     Login user.
@@ -89,12 +96,11 @@ async def login(
     Args:
         data: Login credentials
         request: Request object
-        db: Database session
+        service: Auth service
 
     Returns:
         Auth response with user and tokens
     """
-    service = AuthService(db)
     user_agent, ip_address = get_client_info(request)
     return await service.login(data, user_agent, ip_address)
 
@@ -108,7 +114,7 @@ async def login(
 async def refresh_tokens(
     data: RefreshTokenRequest,
     request: Request,
-    db: AsyncSession = Depends(get_db),
+    service: AuthService = Depends(get_auth_service),
 ) -> TokenResponse:
     """
     Refresh access token.
@@ -116,12 +122,11 @@ async def refresh_tokens(
     Args:
         data: Refresh token
         request: Request object
-        db: Database session
+        service: Auth service
 
     Returns:
         New token response
     """
-    service = AuthService(db)
     user_agent, ip_address = get_client_info(request)
     return await service.refresh_tokens(data.refresh_token, user_agent, ip_address)
 
@@ -134,16 +139,15 @@ async def refresh_tokens(
 )
 async def logout(
     data: RefreshTokenRequest,
-    db: AsyncSession = Depends(get_db),
+    service: AuthService = Depends(get_auth_service),
 ) -> None:
     """
     Logout user.
 
     Args:
         data: Refresh token to revoke
-        db: Database session
+        service: Auth service
     """
-    service = AuthService(db)
     await service.logout(data.refresh_token)
 
 
@@ -155,16 +159,15 @@ async def logout(
 )
 async def logout_all(
     user_id: str = Depends(require_auth),
-    db: AsyncSession = Depends(get_db),
+    service: AuthService = Depends(get_auth_service),
 ) -> None:
     """
     Logout user from all devices.
 
     Args:
         user_id: Authenticated user ID
-        db: Database session
+        service: Auth service
     """
-    service = AuthService(db)
     await service.logout_all(user_id)
 
 
@@ -176,19 +179,18 @@ async def logout_all(
 )
 async def get_current_user(
     user_id: str = Depends(require_auth),
-    db: AsyncSession = Depends(get_db),
+    service: AuthService = Depends(get_auth_service),
 ) -> UserResponse:
     """
     Get current user profile.
 
     Args:
         user_id: Authenticated user ID
-        db: Database session
+        service: Auth service
 
     Returns:
         User response
     """
-    service = AuthService(db)
     return await service.get_user(user_id)
 
 
@@ -201,7 +203,7 @@ async def get_current_user(
 async def update_current_user(
     data: UserUpdate,
     user_id: str = Depends(require_auth),
-    db: AsyncSession = Depends(get_db),
+    service: AuthService = Depends(get_auth_service),
 ) -> UserResponse:
     """
     Update current user profile.
@@ -209,12 +211,11 @@ async def update_current_user(
     Args:
         data: Update data
         user_id: Authenticated user ID
-        db: Database session
+        service: Auth service
 
     Returns:
         Updated user response
     """
-    service = AuthService(db)
     return await service.update_user(user_id, data)
 
 
@@ -227,7 +228,7 @@ async def update_current_user(
 async def change_password(
     data: PasswordChange,
     user_id: str = Depends(require_auth),
-    db: AsyncSession = Depends(get_db),
+    service: AuthService = Depends(get_auth_service),
 ) -> None:
     """
     Change user password.
@@ -235,7 +236,6 @@ async def change_password(
     Args:
         data: Password change data
         user_id: Authenticated user ID
-        db: Database session
+        service: Auth service
     """
-    service = AuthService(db)
     await service.change_password(user_id, data)
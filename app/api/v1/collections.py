@@ -5,10 +5,8 @@ API endpoints for collection management.
 from typing import Any
 
 from fastapi import APIRouter, Depends, Query, status
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.dependencies import require_auth
-from app.db.session import get_db
+from app.core.dependencies import get_collection_service, require_auth
 from app.schemas.collection import (
     CollectionCreate,
     CollectionListResponse,
@@ -29,7 +27,7 @@ router = APIRouter()
 )
 async def create_collection(
     data: CollectionCreate,
-    db: AsyncSession = Depends(get_db),
+    service: CollectionService = Depends(get_collection_service),
     user_id: str = Depends(require_auth),
 ) -> CollectionResponse:
     """
@@ -37,13 +35,12 @@ async def create_collection(
 
     Args:
         data: Collection creation data
-        db: Database session
+        service: Collection service
         user_id: Authenticated user ID
 
     Returns:
         Created collection
     """
-    service = CollectionService(db)
     return await service.create_collection(data)
 
 
@@ -57,7 +54,7 @@ async def list_collections(
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(30, ge=1, le=200, description="Items per page"),
     include_system: bool = Query(False, description="Include system collections"),
-    db: AsyncSession = Depends(get_db),
+    service: CollectionService = Depends(get_collection_service),
 ) -> CollectionListResponse:
     """
     List all collections with pagination.
@@ -66,12 +63,11 @@ async def list_collections(
         page: Page number (1-indexed)
         per_page: Items per page (max 200)
         include_system: Include system collections
-        db: Database session
+        service: Collection service
 
     Returns:
         Paginated list of collections
     """
-    service = CollectionService(db)
     collections, total = await service.list_collections(
         page=page,
         per_page=per_page,
@@ -94,19 +90,18 @@ async def list_collections(
 )
 async def get_collection(
     collection_id: str,
-    db: AsyncSession = Depends(get_db),
+    service: CollectionService = Depends(get_collection_service),
 ) -> CollectionResponse:
     """
     Get collection by ID.
 
     Args:
         collection_id: Collection ID
-        db: Database session
+        service: Collection service
 
     Returns:
         Collection data
     """
-    service = CollectionService(db)
     return await service.get_collection(collection_id)
 
 
@@ -119,7 +114,7 @@ async def get_collection(
 async def update_collection(
     collection_id: str,
     data: CollectionUpdate,
-    db: AsyncSession = Depends(get_db),
+    service: CollectionService = Depends(get_collection_service),
     user_id: str = Depends(require_auth),
 ) -> CollectionResponse:
     """
@@ -128,13 +123,12 @@ async def update_collection(
     Args:
         collection_id: Collection ID
         data: Update data
-        db: Database session
+        service: Collection service
         user_id: Authenticated user ID
 
     Returns:
         Updated collection
     """
-    service = CollectionService(db)
     return await service.update_collection(collection_id, data)
 
 
@@ -146,7 +140,7 @@ async def update_collection(
 )
 async def delete_collection(
     collection_id: str,
-    db: AsyncSession = Depends(get_db),
+    service: CollectionService = Depends(get_collection_service),
     user_id: str = Depends(require_auth),
 ) -> None:
     """
@@ -154,10 +148,9 @@ async def delete_collection(
 
     Args:
         collection_id: Collection ID
-        db: Database session
+        service: Collection service
         user_id: Authenticated user ID
     """
-    service = CollectionService(db)
     await service.delete_collection(collection_id)
 
 
@@ -169,17 +162,16 @@ async def delete_collection(
 )
 async def get_collection_by_name(
     collection_name: str,
-    db: AsyncSession = Depends(get_db),
+    service: CollectionService = Depends(get_collection_service),
 ) -> CollectionResponse:
     """
     Get collection by name.
 
     Args:
         collection_name: Collection name
-        db: Database session
+        service: Collection service
 
     Returns:
         Collection data
     """
-    service = CollectionService(db)
     return await service.get_collection_by_name(collection_name)
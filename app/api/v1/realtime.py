@@ -1,54 +1,48 @@
 """Real-time updates API using Server-Sent Events (SSE)."""
-import asyncio
-from typing import Optional
-from fastapi import APIRouter, Request, Query
+from typing import AsyncIterator, Optional
+from fastapi import APIRouter, Query
 from fastapi.responses import StreamingResponse
 
-from app.core.events import event_manager, Event
+from app.core.events import SubscriberOverflow, event_manager
 from app.core.dependencies import get_optional_user_id
 
 
 router = APIRouter()
 
-
 async def event_generator(
-    request: Request,
     collection_name: Optional[str] = None,
-):
+) -> AsyncIterator[bytes]:
     """
     Generate Server-Sent Events.
 
+    StreamingResponse listens for the client's disconnect and cancels the
+    generator, so the loop only waits on the subscription.
+
     Args:
-        request: FastAPI request (to detect client disconnect)
         collection_name: Optional collection to subscribe to
 
     Yields:
         SSE formatted messages
     """
     # Subscribe to events
-    queue = await event_manager.subscribe(collection_name)
+    subscription = await event_manager.subscribe(collection_name)
 
     try:
         # Send initial connection message
-        yield "event: connected\ndata: {\"status\": \"connected\"}\n\n"
+        yield b"event: connected\ndata: {\"status\": \"connected\"}\n\n"
 
         while True:
-            # Check if client is still connected
-            if await request.is_disconnected():
-                break
-
+            # Blocks until the next event or shared keep-alive frame
             try:
-                # Wait for events with timeout to allow disconnect detection
-                event: Event = await asyncio.wait_for(queue.get(), timeout=1.0)
-                yield event.to_sse_message()
-            except asyncio.TimeoutError:
-                # Send keep-alive comment to prevent connection timeout
-                yield ": keep-alive\n\n"
-                continue
+                frame = await subscription.get()
+            except SubscriberOverflow:
+                # Client can't keep up; close the stream so it reconnects
+                break
+            yield frame
 
     finally:
         # Cleanup on disconnect
-        await event_manager.unsubscribe(queue, collection_name)
+        await event_manager.unsubscribe(subscription)
 
 
 @router.get(
@@ -56,9 +50,8 @@ async def event_generator(
     summary="Subscribe to real-time updates (all collections)",
 )
 async def realtime_all(
-    request: Request,
     user_id: Optional[str] = Query(None),
-):
+) -> StreamingResponse:
     """
     Subscribe to real-time updates for all collections.
 
@@ -85,7 +78,7 @@ async def realtime_all(
     ```
     """
     return StreamingResponse(
-        event_generator(request),
+        event_generator(),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -101,9 +94,8 @@ async def realtime_all(
 )
 async def realtime_collection(
     collection_name: str,
-    request: Request,
     user_id: Optional[str] = Query(None),
-):
+) -> StreamingResponse:
     """
     Subscribe to real-time updates for a specific collection.
 
@@ -130,7 +122,7 @@ async def realtime_collection(
     ```
     """
     return StreamingResponse(
-        event_generator(request, collection_name),
+        event_generator(collection_name),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
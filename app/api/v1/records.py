@@ -7,6 +7,7 @@ from app.db.session import get_db
 from app.services.record_service import RecordService
 from app.schemas.record import (
     RecordCreate,
+    RecordBatchCreate,
     RecordUpdate,
     RecordResponse,
     RecordListResponse,
@@ -35,6 +36,23 @@ async def create_record(
     return await service.create_record(data)
 
 
+@router.post(
+    "/{collection_name}/records:batch",
+    response_model=List[RecordResponse],
+    status_code=201,
+    summary="Create records in bulk",
+)
+async def create_records(
+    collection_name: str = Path(..., description="Collection name"),
+    data: RecordBatchCreate = ...,
+    db: AsyncSession = Depends(get_db),
+    user_id: str = Depends(require_auth),
+):
+    """Create several records in the specified collection in one transaction."""
+    service = RecordService(db, collection_name)
+    return await service.create_records(data)
+
+
 @router.get(
     "/{collection_name}/records",
     response_model=RecordListResponse,
@@ -3,6 +3,7 @@ Application configuration using Pydantic Settings.
 All settings are loaded from environment variables or .env file.
 """
 
+import os
 from typing import List, Literal
 from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -28,12 +29,18 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = "sqlite+aiosqlite:///./data/app.db"
+    DB_POOL_SIZE: int = 20  # Persistent connections kept open (non-SQLite)
+    DB_MAX_OVERFLOW: int = 10  # Extra connections allowed under burst load
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a pooled connection is replaced
+    DB_STATEMENT_CACHE_SIZE: int = 1024  # asyncpg prepared statements per connection
 
     # Security
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    REFRESH_TOKEN_PRUNE_INTERVAL: int = 3600  # Seconds between expired token cleanups
+    BCRYPT_WORKERS: int = os.cpu_count() or 1  # Threads for password hashing
 
     # CORS
     CORS_ORIGINS: List[str] = ["http://localhost:3000", "http://localhost:8000"]
@@ -115,6 +122,10 @@ class Settings(BaseSettings):
     REDIS_URL: str = "redis://localhost:6379/0"
     REDIS_ENABLED: bool = False
 
+    # Real-time (SSE)
+    SSE_BUFFER_SIZE: int = 1024  # Frames kept per channel before slow subscribers are dropped
+    SSE_KEEPALIVE_INTERVAL: int = 15  # Seconds between keep-alive comments
+
     # Rate Limiting
     RATE_LIMIT_ENABLED: bool = True
     RATE_LIMIT_PER_MINUTE: int = 100
@@ -4,22 +4,28 @@ FastAPI dependencies for dependency injection.
 
 from typing import Optional
 
-from fastapi import Depends, Header, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import UnauthorizedException
-from app.core.security import decode_token, verify_token_type
+from app.core.security import decode_access_token
 from app.db.session import get_db
+from app.services.auth_service import AuthService
+from app.services.collection_service import CollectionService
 
+# Reject oversized Authorization headers before parsing them
+MAX_AUTHORIZATION_HEADER_LENGTH = 4096
 
-async def get_current_user_id(
-    authorization: Optional[str] = Header(None),
-) -> Optional[str]:
+
+async def get_current_user_id(request: Request) -> Optional[str]:
     """
     Get current authenticated user ID from JWT token.
 
+    The Authorization header is read straight from the request headers
+    rather than through a validated Header parameter.
+
     Args:
-        authorization: Authorization header with Bearer token
+        request: Incoming request carrying the Bearer token
 
     Returns:
         User ID from token or None if not authenticated
@@ -27,29 +33,22 @@ async def get_current_user_id(
     Raises:
         UnauthorizedException: If token is invalid
     """
+    authorization = request.headers.get("authorization")
     if not authorization:
         return None
 
-    try:
-        scheme, token = authorization.split()
-        if scheme.lower() != "bearer":
-            return None
-
-        payload = decode_token(token)
-        if not payload:
-            raise UnauthorizedException("Invalid or expired token")
+    if len(authorization) > MAX_AUTHORIZATION_HEADER_LENGTH:
+        raise UnauthorizedException("Authorization header too large")
 
-        if not verify_token_type(payload, "access"):
-            raise UnauthorizedException("Invalid token type")
-
-        user_id: str = payload.get("sub")
-        if not user_id:
-            raise UnauthorizedException("Invalid token payload")
+    scheme, sep, token = authorization.partition(" ")
+    if not sep or not token or scheme.lower() != "bearer":
+        return None
 
-        return user_id
+    user_id = decode_access_token(token)
+    if not user_id:
+        raise UnauthorizedException("Invalid or expired token")
 
-    except ValueError:
-        return None
+    return user_id
 
 
 async def require_auth(
@@ -86,3 +85,29 @@ async def get_optional_user_id(
         User ID or None
     """
     return user_id
+
+
+def get_auth_service(db: AsyncSession = Depends(get_db)) -> AuthService:
+    """
+    Dependency that provides a request-scoped auth service.
+
+    Args:
+        db: Database session
+
+    Returns:
+        AuthService bound to the request's session
+    """
+    return AuthService(db)
+
+
+def get_collection_service(db: AsyncSession = Depends(get_db)) -> CollectionService:
+    """
+    Dependency that provides a request-scoped collection service.
+
+    Args:
+        db: Database session
+
+    Returns:
+        CollectionService bound to the request's session
+    """
+    return CollectionService(db)
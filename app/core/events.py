@@ -1,10 +1,15 @@
 """Event manager for real-time updates using Server-Sent Events (SSE)."""
 import asyncio
-import json
-from typing import Dict, Set, Optional, Any
-from datetime import datetime
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Any
+from datetime import datetime, timezone
 from enum import Enum
 
+import orjson
+
+from app.core.config import settings
+
 
 class EventType(str, Enum):
     """Types of events that can be broadcast."""
@@ -17,8 +22,19 @@ class EventType(str, Enum):
     COLLECTION_DELETED = "collection.deleted"
 
 
+# Pre-encoded SSE frame prefix for each event type
+_SSE_PREFIX: Dict[EventType, bytes] = {
+    event_type: f"event: {event_type.value}\ndata: ".encode() for event_type in EventType
+}
+
+
 class Event:
-    """Event data structure."""
+    """
+    Event data structure.
+
+    ``timestamp`` holds epoch seconds as a float; to_dict and the SSE frame
+    carry it as an ISO 8601 UTC string.
+    """
 
     def __init__(
         self,
@@ -31,7 +47,10 @@ class Event:
         self.collection_name = collection_name
         self.data = data
         self.record_id = record_id
-        self.timestamp = datetime.utcnow().isoformat()
+        # Epoch seconds; formatted only when the event is serialized
+        self.timestamp = time.time()
+        # Serialized SSE frame, built once no matter how many subscribers
+        self._sse_bytes: Optional[bytes] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert event to dictionary."""
@@ -40,27 +59,104 @@ class Event:
             "collection": self.collection_name,
             "record_id": self.record_id,
             "data": self.data,
-            "timestamp": self.timestamp,
+            "timestamp": datetime.fromtimestamp(self.timestamp, timezone.utc)
+            .isoformat()
+            .replace("+00:00", "Z"),
         }
 
+    def to_sse_bytes(self) -> bytes:
+        """Format as SSE message bytes (serialized once and cached)."""
+        if self._sse_bytes is None:
+            payload = orjson.dumps(self.to_dict())
+            self._sse_bytes = _SSE_PREFIX[self.event_type] + payload + b"\n\n"
+        return self._sse_bytes
+
     def to_sse_message(self) -> str:
         """Format as SSE message."""
-        data = json.dumps(self.to_dict())
-        return f"event: {self.event_type}\ndata: {data}\n\n"
+        return self.to_sse_bytes().decode("utf-8")
+
+
+# SSE comment frame that keeps idle connections open
+KEEPALIVE_FRAME = b": keep-alive\n\n"
+
+
+class SubscriberOverflow(Exception):
+    """Raised when a subscriber falls further behind than the channel buffer."""
+
+
+class EventChannel:
+    """
+    Shared ring buffer of SSE frames for one subscription scope.
+
+    Publishing appends a frame once and wakes every waiting subscriber;
+    subscribers read from the shared buffer by sequence number instead of
+    each owning a queue.
+    """
+
+    def __init__(self, maxlen: int = settings.SSE_BUFFER_SIZE):
+        self.buffer: Deque[bytes] = deque(maxlen=maxlen)
+        # Sequence number of the newest frame in the buffer
+        self.seq = 0
+        self.cond = asyncio.Condition()
+        self.subscriber_count = 0
+
+    async def publish(self, frame: bytes) -> None:
+        """Append a frame and wake all subscribers."""
+        async with self.cond:
+            self.buffer.append(frame)
+            self.seq += 1
+            self.cond.notify_all()
+
+
+class Subscription:
+    """A subscriber's read cursor into an event channel."""
+
+    def __init__(self, channel: EventChannel, collection_name: Optional[str] = None):
+        self.channel = channel
+        self.collection_name = collection_name
+        # Only frames published after subscribing are delivered
+        self.last_seq = channel.seq
+
+    async def get(self) -> bytes:
+        """
+        Wait for and return the next SSE frame.
+
+        Returns:
+            Next serialized SSE frame
+
+        Raises:
+            SubscriberOverflow: If frames were dropped before this subscriber read them
+        """
+        channel = self.channel
+
+        if channel.seq == self.last_seq:
+            async with channel.cond:
+                while channel.seq == self.last_seq:
+                    await channel.cond.wait()
+
+        missed = channel.seq - self.last_seq
+        if missed > len(channel.buffer):
+            # Too slow to keep up; stale events are useless, so drop the subscriber
+            raise SubscriberOverflow(
+                f"Subscriber missed {missed - len(channel.buffer)} events"
+            )
+
+        self.last_seq += 1
+        return channel.buffer[-missed]
 
 
 class EventManager:
     """Manages SSE connections and event broadcasting."""
 
-    def __init__(self):
-        # Collection name -> set of queues
-        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
-        # Global subscribers (all events)
-        self._global_subscribers: Set[asyncio.Queue] = set()
+    def __init__(self) -> None:
+        # Collection name -> channel (None key holds global subscribers)
+        self._channels: Dict[Optional[str], EventChannel] = {}
+        # Single task sending keep-alives to every channel
+        self._keepalive_task: Optional[asyncio.Task[None]] = None
 
     async def subscribe(
         self, collection_name: Optional[str] = None
-    ) -> asyncio.Queue:
+    ) -> Subscription:
         """
         Subscribe to events.
 
@@ -68,60 +164,86 @@ class EventManager:
             collection_name: Subscribe to specific collection, or None for all events
 
         Returns:
-            Queue that will receive events
+            Subscription that will receive serialized SSE frames
         """
-        queue = asyncio.Queue()
+        key = collection_name or None
 
-        if collection_name:
-            if collection_name not in self._subscribers:
-                self._subscribers[collection_name] = set()
-            self._subscribers[collection_name].add(queue)
-        else:
-            self._global_subscribers.add(queue)
+        channel = self._channels.get(key)
+        if channel is None:
+            channel = self._channels[key] = EventChannel()
+        channel.subscriber_count += 1
 
-        return queue
+        if self._keepalive_task is None or self._keepalive_task.done():
+            self._keepalive_task = asyncio.create_task(self._keepalive_loop())
 
-    async def unsubscribe(
-        self, queue: asyncio.Queue, collection_name: Optional[str] = None
-    ):
+        return Subscription(channel, key)
+
+    async def unsubscribe(self, subscription: Subscription) -> None:
         """Unsubscribe from events."""
-        if collection_name:
-            if collection_name in self._subscribers:
-                self._subscribers[collection_name].discard(queue)
-                if not self._subscribers[collection_name]:
-                    del self._subscribers[collection_name]
-        else:
-            self._global_subscribers.discard(queue)
-
-    async def broadcast(self, event: Event):
+        key = subscription.collection_name
+        channel = self._channels.get(key)
+
+        if channel is subscription.channel:
+            channel.subscriber_count -= 1
+            if channel.subscriber_count <= 0:
+                del self._channels[key]
+
+    async def broadcast(self, event: Event) -> None:
         """
         Broadcast an event to all relevant subscribers.
 
+        The event is serialized once and appended to the collection channel
+        and the global channel; subscribers pick it up from there.
+
         Args:
             event: Event to broadcast
         """
+        if not self.has_subscribers(event.collection_name):
+            return
+
+        frame = event.to_sse_bytes()
+
         # Send to collection-specific subscribers
-        if event.collection_name in self._subscribers:
-            for queue in self._subscribers[event.collection_name].copy():
-                try:
-                    await queue.put(event)
-                except Exception:
-                    # Remove dead subscriber
-                    self._subscribers[event.collection_name].discard(queue)
+        channel = self._channels.get(event.collection_name)
+        if channel is not None:
+            await channel.publish(frame)
 
         # Send to global subscribers
-        for queue in self._global_subscribers.copy():
-            try:
-                await queue.put(event)
-            except Exception:
-                # Remove dead subscriber
-                self._global_subscribers.discard(queue)
+        channel = self._channels.get(None)
+        if channel is not None:
+            await channel.publish(frame)
+
+    def has_subscribers(self, collection_name: str) -> bool:
+        """
+        Check whether an event for a collection would reach anyone.
+
+        Callers can use this to skip building events nobody will receive.
+
+        Args:
+            collection_name: Collection the event belongs to
+
+        Returns:
+            True if there are collection or global subscribers
+        """
+        return collection_name in self._channels or None in self._channels
+
+    async def _keepalive_loop(self) -> None:
+        """Periodically publish a keep-alive frame to all channels while any exist."""
+        while self._channels:
+            await asyncio.sleep(settings.SSE_KEEPALIVE_INTERVAL)
+            for channel in list(self._channels.values()):
+                await channel.publish(KEEPALIVE_FRAME)
+
+    async def close(self) -> None:
+        """Stop the keep-alive task (called on application shutdown)."""
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
 
     def get_subscriber_count(self, collection_name: Optional[str] = None) -> int:
         """Get number of active subscribers."""
-        if collection_name:
-            return len(self._subscribers.get(collection_name, set()))
-        return len(self._global_subscribers)
+        channel = self._channels.get(collection_name or None)
+        return channel.subscriber_count if channel is not None else 0
 
 
 # Global event manager instance
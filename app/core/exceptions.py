@@ -8,6 +8,10 @@ from typing import Any, Dict, Optional
 class FastCMSException(Exception):
     """Base exception class for FastCMS."""
 
+    # Keep the core attributes in slots. BaseException still provides an
+    # instance __dict__, so other attributes can be set as usual.
+    __slots__ = ("message", "status_code", "details")
+
     def __init__(
         self,
         message: str,
@@ -23,6 +27,8 @@ class FastCMSException(Exception):
 class NotFoundException(FastCMSException):
     """Exception raised when a resource is not found."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Resource not found", details: Optional[Dict[str, Any]] = None) -> None:
         super().__init__(message, status_code=404, details=details)
 
@@ -30,6 +36,8 @@ class NotFoundException(FastCMSException):
 class UnauthorizedException(FastCMSException):
     """Exception raised when authentication fails."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Unauthorized", details: Optional[Dict[str, Any]] = None) -> None:
         super().__init__(message, status_code=401, details=details)
 
@@ -37,6 +45,8 @@ class UnauthorizedException(FastCMSException):
 class ForbiddenException(FastCMSException):
     """Exception raised when user doesn't have permission."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Forbidden", details: Optional[Dict[str, Any]] = None) -> None:
         super().__init__(message, status_code=403, details=details)
 
@@ -44,6 +54,8 @@ class ForbiddenException(FastCMSException):
 class BadRequestException(FastCMSException):
     """Exception raised when request data is invalid."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Bad request", details: Optional[Dict[str, Any]] = None) -> None:
         super().__init__(message, status_code=400, details=details)
 
@@ -51,6 +63,8 @@ class BadRequestException(FastCMSException):
 class ConflictException(FastCMSException):
     """Exception raised when there's a conflict (e.g., duplicate resource)."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Resource conflict", details: Optional[Dict[str, Any]] = None) -> None:
         super().__init__(message, status_code=409, details=details)
 
@@ -58,6 +72,8 @@ class ConflictException(FastCMSException):
 class ValidationException(FastCMSException):
     """Exception raised when data validation fails."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Validation failed", details: Optional[Dict[str, Any]] = None) -> None:
         super().__init__(message, status_code=422, details=details)
 
@@ -65,6 +81,8 @@ class ValidationException(FastCMSException):
 class TooManyRequestsException(FastCMSException):
     """Exception raised when rate limit is exceeded."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Too many requests", details: Optional[Dict[str, Any]] = None) -> None:
         super().__init__(message, status_code=429, details=details)
 
@@ -72,6 +90,8 @@ class TooManyRequestsException(FastCMSException):
 class DatabaseException(FastCMSException):
     """Exception raised when database operation fails."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Database error", details: Optional[Dict[str, Any]] = None) -> None:
         super().__init__(message, status_code=500, details=details)
 
@@ -79,6 +99,8 @@ class DatabaseException(FastCMSException):
 class FileStorageException(FastCMSException):
     """Exception raised when file storage operation fails."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "File storage error", details: Optional[Dict[str, Any]] = None) -> None:
         super().__init__(message, status_code=500, details=details)
 
@@ -86,5 +108,7 @@ class FileStorageException(FastCMSException):
 class AIServiceException(FastCMSException):
     """Exception raised when AI service operation fails."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "AI service error", details: Optional[Dict[str, Any]] = None) -> None:
         super().__init__(message, status_code=500, details=details)
@@ -4,7 +4,7 @@ Structured logging configuration with JSON support.
 
 import logging
 import sys
-from datetime import datetime
+import time
 from typing import Any, Dict
 
 import orjson
@@ -17,8 +17,15 @@ class JSONFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
+        return self.format_bytes(record).decode("utf-8")
+
+    def format_bytes(self, record: logging.LogRecord) -> bytes:
+        """Format log record as UTF-8 encoded JSON."""
+        # Reuse the creation time the record already carries
+        timestamp = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created))
+
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": f"{timestamp}.{int(record.msecs):03d}Z",
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -32,14 +39,37 @@ class JSONFormatter(logging.Formatter):
             log_data["exception"] = self.formatException(record.exc_info)
 
         # Add extra fields from record
-        if hasattr(record, "request_id"):
-            log_data["request_id"] = record.request_id
+        extra = record.__dict__
+        if "request_id" in extra:
+            log_data["request_id"] = extra["request_id"]
 
-        if hasattr(record, "user_id"):
-            log_data["user_id"] = record.user_id
+        if "user_id" in extra:
+            log_data["user_id"] = extra["user_id"]
 
         # Use orjson for fast JSON serialization
-        return orjson.dumps(log_data).decode("utf-8")
+        return orjson.dumps(log_data)
+
+
+class JSONStreamHandler(logging.StreamHandler):
+    """Stream handler that writes JSON log lines as raw bytes."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write the record straight to the stream's binary buffer."""
+        buffer = getattr(self.stream, "buffer", None)
+        if buffer is None or not isinstance(self.formatter, JSONFormatter):
+            # Text-only stream (e.g. captured output), use the regular path
+            super().emit(record)
+            return
+
+        try:
+            # Push out any text already queued on the stream so lines stay in order
+            self.stream.flush()
+            buffer.write(self.formatter.format_bytes(record) + b"\n")
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 
 def setup_logging() -> None:
@@ -51,13 +81,12 @@ def setup_logging() -> None:
     # Remove existing handlers
     logger.handlers.clear()
 
-    # Create console handler
-    handler = logging.StreamHandler(sys.stdout)
-
-    # Set formatter based on configuration
+    # Create console handler and formatter based on configuration
     if settings.LOG_FORMAT == "json":
-        formatter = JSONFormatter()
+        handler: logging.Handler = JSONStreamHandler(sys.stdout)
+        formatter: logging.Formatter = JSONFormatter()
     else:
+        handler = logging.StreamHandler(sys.stdout)
         formatter = logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
@@ -2,16 +2,47 @@
 Security utilities for password hashing and JWT token management.
 """
 
+import asyncio
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import bcrypt
+import jwt
 
 from app.core.config import settings
 
-# Password hashing context with bcrypt (cost factor 12 for security)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=12)
+# Bcrypt cost factor (12 for security)
+BCRYPT_ROUNDS = 12
+
+# Bcrypt only uses the first 72 bytes of a password
+BCRYPT_MAX_PASSWORD_BYTES = 72
+
+# Dedicated pool for bcrypt so hashing never blocks the event loop
+# (bcrypt releases the GIL, so these threads run in parallel)
+_bcrypt_executor = ThreadPoolExecutor(
+    max_workers=settings.BCRYPT_WORKERS,
+    thread_name_prefix="bcrypt",
+)
+
+# Decoded JWT payloads keyed by raw token string (LRU, entries expire with the token)
+TOKEN_CACHE_MAX_SIZE = 10000
+_token_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+# Digest size in bytes for stored refresh token hashes (BLAKE2b-128)
+TOKEN_HASH_SIZE = 16
+
+# Random bytes per user token key, and how many keys are read from the OS at once
+TOKEN_KEY_BYTES = 32
+TOKEN_KEY_BATCH_SIZE = 64
+_token_key_pool: List[str] = []
+
+# A forked worker must not hand out the same keys as its parent
+os.register_at_fork(after_in_child=_token_key_pool.clear)
 
 
 def hash_password(password: str) -> str:
@@ -24,7 +55,8 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password string
     """
-    return pwd_context.hash(password)
+    password_bytes = password.encode("utf-8")[:BCRYPT_MAX_PASSWORD_BYTES]
+    return bcrypt.hashpw(password_bytes, bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode("utf-8")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -38,7 +70,55 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    password_bytes = plain_password.encode("utf-8")[:BCRYPT_MAX_PASSWORD_BYTES]
+    return bcrypt.checkpw(password_bytes, hashed_password.encode("utf-8"))
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password using bcrypt without blocking the event loop.
+
+    Args:
+        password: Plain text password
+
+    Returns:
+        Hashed password string
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_bcrypt_executor, hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password against a hashed password without blocking the event loop.
+
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Hashed password to compare against
+
+    Returns:
+        True if password matches, False otherwise
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _bcrypt_executor, verify_password, plain_password, hashed_password
+    )
+
+
+def generate_token_key() -> str:
+    """
+    Generate a random per-user token key used to invalidate sessions.
+
+    Entropy for a batch of keys is read with a single os.urandom call.
+
+    Returns:
+        Hex string of TOKEN_KEY_BYTES random bytes
+    """
+    if not _token_key_pool:
+        raw = os.urandom(TOKEN_KEY_BYTES * TOKEN_KEY_BATCH_SIZE).hex()
+        step = TOKEN_KEY_BYTES * 2
+        _token_key_pool.extend(raw[i:i + step] for i in range(0, len(raw), step))
+    return _token_key_pool.pop()
 
 
 def create_access_token(
@@ -97,21 +177,68 @@ def create_refresh_token(
     return encoded_jwt
 
 
+def hash_token(token: str) -> bytes:
+    """
+    Compute the fixed-size digest used to store and look up refresh tokens.
+
+    Args:
+        token: Token string
+
+    Returns:
+        BLAKE2b digest of TOKEN_HASH_SIZE bytes
+    """
+    return hashlib.blake2b(token.encode(), digest_size=TOKEN_HASH_SIZE).digest()
+
+
 def decode_token(token: str) -> Optional[Dict[str, Any]]:
     """
     Decode and validate a JWT token.
 
+    Successfully decoded tokens are cached until they expire, so repeated
+    requests with the same token skip signature verification.
+
     Args:
         token: JWT token string to decode
 
     Returns:
         Decoded token payload or None if invalid
     """
+    payload = _token_cache.get(token)
+    if payload is not None:
+        if payload["exp"] > time.time():
+            _token_cache.move_to_end(token)
+            return payload
+        _token_cache.pop(token, None)
+
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
-    except JWTError:
+    except jwt.PyJWTError:
+        return None
+
+    # Only cache tokens that carry an expiry so entries can't outlive them
+    if isinstance(payload.get("exp"), (int, float)):
+        _token_cache[token] = payload
+        if len(_token_cache) > TOKEN_CACHE_MAX_SIZE:
+            _token_cache.popitem(last=False)
+
+    return payload
+
+
+def decode_access_token(token: str) -> Optional[str]:
+    """
+    Decode an access token and return its subject.
+
+    Args:
+        token: JWT access token string
+
+    Returns:
+        User ID from the token, or None if the token is invalid, expired,
+        not an access token, or has no subject
+    """
+    payload = decode_token(token)
+    if payload is None or payload.get("type") != "access":
         return None
+    return payload.get("sub")
 
 
 def verify_token_type(payload: Dict[str, Any], expected_type: str) -> bool:
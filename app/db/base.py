@@ -22,10 +22,26 @@ class Base(DeclarativeBase):
 
     metadata = metadata
 
+    # Column keys shown by __repr__, computed once per mapped class
+    _repr_columns: tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        table = cls.__dict__.get("__table__")
+        if table is not None:
+            cls._repr_columns = tuple(table.columns.keys())
+
     def __repr__(self) -> str:
-        """String representation of model."""
+        """
+        String representation of model.
+
+        Only already-loaded attributes are shown, so repr never triggers
+        a lazy load (e.g. for expired or deferred columns).
+        """
+        loaded = self.__dict__
         columns = ", ".join(
-            f"{col}={getattr(self, col)!r}"
-            for col in self.__table__.columns.keys()
+            f"{col}={loaded[col]!r}"
+            for col in self._repr_columns
+            if col in loaded
         )
         return f"<{self.__class__.__name__}({columns})>"
@@ -2,19 +2,38 @@
 Base model with common fields for all models.
 """
 
-import uuid
+import os
 from datetime import datetime, timezone
-from typing import Any
+from operator import attrgetter
+from typing import Any, Callable, List, Tuple
 
 from sqlalchemy import DateTime, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
 
+# Random bytes for this many UUIDs are read from the OS in one call
+UUID_BATCH_SIZE = 256
+
+_uuid_pool: List[bytes] = []
+
+# A forked worker must not hand out the same UUIDs as its parent
+os.register_at_fork(after_in_child=_uuid_pool.clear)
+
+
+def _refill_uuid_pool() -> None:
+    """Read a batch of random bytes and split it into 16-byte UUID seeds."""
+    raw = os.urandom(16 * UUID_BATCH_SIZE)
+    _uuid_pool.extend(raw[i:i + 16] for i in range(0, len(raw), 16))
+
 
 def generate_uuid() -> str:
-    """Generate a UUID string."""
-    return str(uuid.uuid4())
+    """Generate a random (version 4) UUID string."""
+    if not _uuid_pool:
+        _refill_uuid_pool()
+    h = _uuid_pool.pop().hex()
+    # Set the version nibble to 4 and the variant bits to RFC 4122
+    return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{'89ab'[int(h[16], 16) & 3]}{h[17:20]}-{h[20:]}"
 
 
 def utcnow() -> datetime:
@@ -52,9 +71,22 @@ class BaseModel(Base):
         nullable=False,
     )
 
+    # Column names and a C-level getter for them, built once per mapped class
+    _dict_columns: Tuple[str, ...] = ()
+    _dict_getter: Callable[[Any], Tuple[Any, ...]]
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        table = cls.__dict__.get("__table__")
+        if table is not None:
+            cls._dict_columns = tuple(column.name for column in table.columns)
+            getter = attrgetter(*cls._dict_columns)
+            if len(cls._dict_columns) == 1:
+                # attrgetter returns a bare value for a single name
+                cls._dict_getter = lambda obj: (getter(obj),)
+            else:
+                cls._dict_getter = getter
+
     def to_dict(self) -> dict[str, Any]:
         """Convert model to dictionary."""
-        return {
-            column.name: getattr(self, column.name)
-            for column in self.__table__.columns
-        }
+        return dict(zip(self._dict_columns, self._dict_getter(self), strict=True))
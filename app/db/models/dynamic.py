@@ -17,6 +17,7 @@ from sqlalchemy import (
     Text,
     JSON as SQLJSON,
 )
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -124,6 +125,9 @@ class DynamicModelGenerator:
         for field in fields:
             columns[field.name] = cls._get_column_for_field(field)
 
+        # User-defined column names, read directly when building responses
+        columns["_data_columns"] = tuple(field.name for field in fields)
+
         # Create the model class dynamically
         model_name = f"{collection_name.capitalize()}Model"
         model_class = type(
@@ -166,18 +170,26 @@ class DynamicModelGenerator:
     @classmethod
     async def create_table(
         cls,
-        engine: Any,
+        bind: AsyncEngine | AsyncConnection,
         model: Type[BaseModel],
     ) -> None:
         """
         Create database table for a model.
 
+        Only the model's own table is created; metadata.create_all would
+        check every registered table first.
+
         Args:
-            engine: SQLAlchemy async engine
+            bind: SQLAlchemy async engine, or an open async connection whose
+                transaction the DDL should join
             model: Model class to create table for
         """
-        async with engine.begin() as conn:
-            await conn.run_sync(model.metadata.create_all)
+        if isinstance(bind, AsyncConnection):
+            await bind.run_sync(model.__table__.create, checkfirst=True)
+            return
+
+        async with bind.begin() as conn:
+            await conn.run_sync(model.__table__.create, checkfirst=True)
 
     @classmethod
     async def drop_table(
@@ -192,5 +204,7 @@ class DynamicModelGenerator:
             engine: SQLAlchemy async engine
             model: Model class to drop table for
         """
+        # Drop only this model's table; metadata.drop_all would drop every table
         async with engine.begin() as conn:
-            await conn.run_sync(model.metadata.drop_all)
+            await conn.run_sync(model.__table__.drop, checkfirst=True)
+        model.metadata.remove(model.__table__)
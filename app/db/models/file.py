@@ -1,6 +1,6 @@
 """File model for storing uploaded file metadata."""
 from typing import Optional
-from sqlalchemy import String, Integer, Boolean
+from sqlalchemy import String, Integer, Boolean, Index, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.models.base import BaseModel
@@ -10,6 +10,19 @@ class File(BaseModel):
     """File model storing metadata for uploaded files."""
 
     __tablename__ = "files"
+    __table_args__ = (
+        # Listing files attached to a record
+        Index("ix_files_collection_record", "collection_name", "record_id"),
+        # Listing a user's files; partial so soft-deleted rows stay out of the index
+        Index(
+            "ix_files_user_active",
+            "user_id",
+            postgresql_where=text("deleted = false"),
+            sqlite_where=text("deleted = 0"),
+        ),
+        # Thumbnail lookup by parent file
+        Index("ix_files_parent", "parent_file_id"),
+    )
 
     # File metadata
     filename: Mapped[str] = mapped_column(String(255), nullable=False)
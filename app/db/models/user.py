@@ -2,9 +2,12 @@
 User model for authentication.
 """
 
-from sqlalchemy import Boolean, String, Text
+from datetime import datetime
+
+from sqlalchemy import Boolean, DateTime, Index, LargeBinary, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column
 
+from app.core.security import TOKEN_HASH_SIZE
 from app.db.models.base import BaseModel
 
 
@@ -80,6 +83,15 @@ class RefreshToken(BaseModel):
     """
 
     __tablename__ = "refresh_tokens"
+    __table_args__ = (
+        # Active tokens per user (logout-all); revoked rows stay out of the index
+        Index(
+            "ix_refresh_user_active",
+            "user_id",
+            postgresql_where=text("revoked = false"),
+            sqlite_where=text("revoked = 0"),
+        ),
+    )
 
     user_id: Mapped[str] = mapped_column(
         String(36),
@@ -90,14 +102,21 @@ class RefreshToken(BaseModel):
     token: Mapped[str] = mapped_column(
         Text,
         nullable=False,
+    )
+
+    # BLAKE2b digest of the token; a small fixed-size key for lookups
+    token_hash: Mapped[bytes] = mapped_column(
+        LargeBinary(TOKEN_HASH_SIZE),
+        nullable=False,
         unique=True,
         index=True,
     )
 
-    # Token is valid until this timestamp
-    expires_at: Mapped[str] = mapped_column(
-        String(50),
+    # Token is valid until this timestamp (indexed for expiry pruning)
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
         nullable=False,
+        index=True,
     )
 
     # Device/client info for tracking
@@ -2,13 +2,36 @@
 Repository for Collection database operations.
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import func, select
+from sqlalchemy import bindparam, delete, exists, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from app.db.models.collection import Collection
 
+# Fail loudly on lazy loads; relationships consumed by callers must be eager-loaded
+NO_LAZY_LOAD = raiseload("*")
+
+# Lookup statements built once at import; only the bound value changes per call
+SELECT_BY_ID = (
+    select(Collection)
+    .where(Collection.id == bindparam("collection_id"))
+    .options(NO_LAZY_LOAD)
+)
+SELECT_BY_NAME = (
+    select(Collection)
+    .where(Collection.name == bindparam("name"))
+    .options(NO_LAZY_LOAD)
+)
+NAME_EXISTS = select(exists().where(Collection.name == bindparam("name")))
+NAME_TAKEN = select(
+    exists().where(
+        Collection.name == bindparam("name"),
+        Collection.id != bindparam("collection_id"),
+    )
+)
+
 
 class CollectionRepository:
     """Repository for collection CRUD operations."""
@@ -48,7 +71,7 @@ class CollectionRepository:
             Collection or None if not found
         """
         result = await self.db.execute(
-            select(Collection).where(Collection.id == collection_id)
+            SELECT_BY_ID, {"collection_id": collection_id}
         )
         return result.scalar_one_or_none()
 
@@ -62,9 +85,7 @@ class CollectionRepository:
         Returns:
             Collection or None if not found
         """
-        result = await self.db.execute(
-            select(Collection).where(Collection.name == name)
-        )
+        result = await self.db.execute(SELECT_BY_NAME, {"name": name})
         return result.scalar_one_or_none()
 
     async def get_all(
@@ -84,7 +105,7 @@ class CollectionRepository:
         Returns:
             List of collections
         """
-        query = select(Collection)
+        query = select(Collection).options(NO_LAZY_LOAD)
 
         if not include_system:
             query = query.where(Collection.system == False)
@@ -94,6 +115,45 @@ class CollectionRepository:
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
+    async def get_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        include_system: bool = True,
+    ) -> Tuple[List[Collection], int]:
+        """
+        Get a page of collections together with the total count.
+
+        The total is computed with a window function so rows and count
+        come back in a single round trip.
+
+        Args:
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            include_system: Include system collections
+
+        Returns:
+            Tuple of (collections, total_count)
+        """
+        query = select(
+            Collection, func.count().over().label("total")
+        ).options(NO_LAZY_LOAD)
+
+        if not include_system:
+            query = query.where(Collection.system == False)
+
+        query = query.offset(skip).limit(limit).order_by(Collection.created.desc())
+
+        result = await self.db.execute(query)
+        rows = result.all()
+
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+
+        # Page past the end yields no rows to carry the window total
+        total = await self.count(include_system=include_system) if skip else 0
+        return [], total
+
     async def count(self, include_system: bool = True) -> int:
         """
         Count total collections.
@@ -126,6 +186,44 @@ class CollectionRepository:
         await self.db.refresh(collection)
         return collection
 
+    async def update_by_id(
+        self, collection_id: str, values: Dict[str, Any]
+    ) -> Optional[Collection]:
+        """
+        Update a non-system collection in a single UPDATE ... RETURNING.
+
+        Args:
+            collection_id: Collection ID
+            values: Column values to set
+
+        Returns:
+            Updated collection, or None if no modifiable collection matched
+        """
+        result = await self.db.execute(
+            update(Collection)
+            .where(Collection.id == collection_id, Collection.system == False)
+            .values(**values)
+            .returning(Collection)
+        )
+        return result.scalar_one_or_none()
+
+    async def delete_by_id(self, collection_id: str) -> Optional[str]:
+        """
+        Delete a non-system collection in a single DELETE ... RETURNING.
+
+        Args:
+            collection_id: Collection ID
+
+        Returns:
+            Name of the deleted collection, or None if no modifiable collection matched
+        """
+        result = await self.db.execute(
+            delete(Collection)
+            .where(Collection.id == collection_id, Collection.system == False)
+            .returning(Collection.name)
+        )
+        return result.scalar_one_or_none()
+
     async def delete(self, collection: Collection) -> None:
         """
         Delete a collection.
@@ -146,8 +244,22 @@ class CollectionRepository:
         Returns:
             True if exists, False otherwise
         """
+        # EXISTS stops at the first index hit instead of counting matches
+        result = await self.db.execute(NAME_EXISTS, {"name": name})
+        return bool(result.scalar())
+
+    async def name_taken(self, name: str, collection_id: str) -> bool:
+        """
+        Check if another collection already uses a name.
+
+        Args:
+            name: Collection name
+            collection_id: ID of the collection being renamed
+
+        Returns:
+            True if a different collection has the name, False otherwise
+        """
         result = await self.db.execute(
-            select(func.count(Collection.id)).where(Collection.name == name)
+            NAME_TAKEN, {"name": name, "collection_id": collection_id}
         )
-        count = result.scalar_one()
-        return count > 0
+        return bool(result.scalar())
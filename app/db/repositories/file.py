@@ -1,5 +1,5 @@
 """Repository for file operations."""
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy import select, func, desc
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -73,6 +73,46 @@ class FileRepository:
         result = await self.db.execute(query)
         return result.scalar_one()
 
+    async def get_page(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        collection_name: Optional[str] = None,
+        record_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+    ) -> Tuple[List[File], int]:
+        """Get a page of files and the total count in a single windowed query."""
+        query = select(File, func.count().over().label("total")).where(
+            File.deleted == False
+        )
+
+        if collection_name:
+            query = query.where(File.collection_name == collection_name)
+
+        if record_id:
+            query = query.where(File.record_id == record_id)
+
+        if user_id:
+            query = query.where(File.user_id == user_id)
+
+        query = query.order_by(desc(File.created)).offset(skip).limit(limit)
+
+        result = await self.db.execute(query)
+        rows = result.all()
+
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+
+        # Page past the end yields no rows to carry the window total
+        if not skip:
+            return [], 0
+        total = await self.count(
+            collection_name=collection_name,
+            record_id=record_id,
+            user_id=user_id,
+        )
+        return [], total
+
     async def soft_delete(self, file_id: str) -> bool:
         """Soft delete a file."""
         file = await self.get_by_id(file_id)
@@ -1,11 +1,26 @@
 """Repository for dynamic record operations."""
-from typing import Any, Dict, List, Optional, Type
-from sqlalchemy import select, func, and_, or_, asc, desc
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, cast
+from sqlalchemy import select, func, and_, or_, asc, desc, delete, insert, update
+from sqlalchemy.engine import CursorResult, Result
+from sqlalchemy.exc import OperationalError, ProgrammingError
+from sqlalchemy.sql import Executable
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.exceptions import NotFoundException
 from app.db.models.dynamic import DynamicModelGenerator
 from app.db.models.base import BaseModel
 from app.schemas.record import RecordFilter
 
+# SQLSTATE for "undefined table" (PostgreSQL)
+UNDEFINED_TABLE_SQLSTATE = "42P01"
+
+
+def _is_missing_table(error: Exception) -> bool:
+    """Check whether a driver error means the table does not exist."""
+    orig = getattr(error, "orig", None)
+    sqlstate = getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)
+    return sqlstate == UNDEFINED_TABLE_SQLSTATE or "no such table" in str(orig)
+
 
 class RecordRepository:
     """Repository for CRUD operations on dynamic collection records."""
@@ -18,24 +33,56 @@ class RecordRepository:
     async def _get_model(self) -> Type[BaseModel]:
         """Get or cache the dynamic model for this collection."""
         if self.model is None:
-            self.model = await DynamicModelGenerator.get_model(self.collection_name)
+            self.model = DynamicModelGenerator.get_model(self.collection_name)
             if self.model is None:
                 raise ValueError(f"Collection '{self.collection_name}' does not exist")
         return self.model
 
+    @contextmanager
+    def _missing_table_guard(self) -> Iterator[None]:
+        """
+        Turn a dropped collection table into a NotFoundException.
+
+        Another worker may have deleted the collection while this worker still
+        had it cached; evicting the stale model makes CollectionService drop
+        its cached schema on the next lookup and re-read the collection.
+        """
+        try:
+            yield
+        except (OperationalError, ProgrammingError) as e:
+            if not _is_missing_table(e):
+                raise
+            DynamicModelGenerator.clear_cache(self.collection_name)
+            raise NotFoundException(f"Collection '{self.collection_name}' not found") from e
+
+    async def _execute(self, statement: Executable) -> Result[Any]:
+        """Execute a statement against the collection table."""
+        with self._missing_table_guard():
+            return await self.db.execute(statement)
+
     async def create(self, data: Dict[str, Any]) -> BaseModel:
         """Create a new record."""
         model = await self._get_model()
         record = model(**data)
         self.db.add(record)
-        await self.db.flush()
+        with self._missing_table_guard():
+            await self.db.flush()
         await self.db.refresh(record)
         return record
 
+    async def create_many(self, rows: List[Dict[str, Any]]) -> List[BaseModel]:
+        """Create several records with one batched INSERT ... RETURNING."""
+        model = await self._get_model()
+        with self._missing_table_guard():
+            result = await self.db.scalars(
+                insert(model).returning(model, sort_by_parameter_order=True), rows
+            )
+        return list(result.all())
+
     async def get_by_id(self, record_id: str) -> Optional[BaseModel]:
         """Get a record by ID."""
         model = await self._get_model()
-        result = await self.db.execute(
+        result = await self._execute(
             select(model).where(model.id == record_id)
         )
         return result.scalar_one_or_none()
@@ -57,18 +104,42 @@ class RecordRepository:
             query = self._apply_filters(query, model, filters)
 
         # Apply sorting
-        if sort_field and hasattr(model, sort_field):
-            sort_col = getattr(model, sort_field)
-            query = query.order_by(desc(sort_col) if sort_order == "desc" else asc(sort_col))
-        else:
-            # Default sort by created desc
-            query = query.order_by(desc(model.created))
+        query = self._apply_sort(query, model, sort_field, sort_order)
 
         # Apply pagination
         query = query.offset(skip).limit(limit)
 
-        result = await self.db.execute(query)
-        return list(result.scalars.all())
+        result = await self._execute(query)
+        return list(result.scalars().all())
+
+    async def get_page(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        filters: Optional[List[RecordFilter]] = None,
+        sort_field: Optional[str] = None,
+        sort_order: str = "asc",
+    ) -> Tuple[List[BaseModel], int]:
+        """Get a page of records and the total count in a single windowed query."""
+        model = await self._get_model()
+        query = select(model, func.count().over().label("total"))
+
+        if filters:
+            query = self._apply_filters(query, model, filters)
+
+        query = self._apply_sort(query, model, sort_field, sort_order)
+        query = query.offset(skip).limit(limit)
+
+        result = await self._execute(query)
+        rows = result.all()
+
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+
+        # Page past the end yields no rows to carry the window total
+        if not skip:
+            return [], 0
+        return [], await self.count(filters=filters)
 
     async def count(self, filters: Optional[List[RecordFilter]] = None) -> int:
         """Count records with optional filtering."""
@@ -79,32 +150,36 @@ class RecordRepository:
         if filters:
             query = self._apply_filters(query, model, filters)
 
-        result = await self.db.execute(query)
-        return result.scalar_one()
+        result = await self._execute(query)
+        return int(result.scalar_one())
 
     async def update(self, record_id: str, data: Dict[str, Any]) -> Optional[BaseModel]:
-        """Update a record."""
-        record = await self.get_by_id(record_id)
-        if not record:
-            return None
-
-        for key, value in data.items():
-            if hasattr(record, key):
-                setattr(record, key, value)
+        """Update a record in a single UPDATE ... RETURNING."""
+        model = await self._get_model()
+        columns = model.__table__.columns
+        values = {key: value for key, value in data.items() if key in columns}
 
-        await self.db.flush()
-        await self.db.refresh(record)
-        return record
+        result = await self._execute(
+            update(model).where(model.id == record_id).values(**values).returning(model)
+        )
+        return result.scalar_one_or_none()
 
     async def delete(self, record_id: str) -> bool:
-        """Delete a record."""
-        record = await self.get_by_id(record_id)
-        if not record:
-            return False
-
-        await self.db.delete(record)
-        await self.db.flush()
-        return True
+        """Delete a record in a single DELETE."""
+        model = await self._get_model()
+        result = await self._execute(delete(model).where(model.id == record_id))
+        # DML statements come back as a CursorResult, which carries the row count
+        return cast(CursorResult[Any], result).rowcount > 0
+
+    def _apply_sort(
+        self, query, model: Type[BaseModel], sort_field: Optional[str], sort_order: str
+    ):
+        """Apply sorting to query."""
+        if sort_field and hasattr(model, sort_field):
+            sort_col = getattr(model, sort_field)
+            return query.order_by(desc(sort_col) if sort_order == "desc" else asc(sort_col))
+        # Default sort by created desc
+        return query.order_by(desc(model.created))
 
     def _apply_filters(self, query, model: Type[BaseModel], filters: List[RecordFilter]):
         """Apply filters to query."""
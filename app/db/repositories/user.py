@@ -5,9 +5,11 @@ Repository for User and RefreshToken database operations.
 from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import delete, or_, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.security import hash_token
 from app.db.models.user import RefreshToken, User
 
 
@@ -38,6 +40,44 @@ class UserRepository:
         await self.db.refresh(user)
         return user
 
+    async def insert_if_absent(self, user: User) -> Optional[User]:
+        """
+        Create a user unless the email is already taken.
+
+        On PostgreSQL and SQLite this is a single atomic
+        INSERT ... ON CONFLICT (email) DO NOTHING RETURNING statement, so there
+        is no separate existence check and no race between check and insert.
+
+        Args:
+            user: User instance to create
+
+        Returns:
+            Created user, or None if a user with the same email exists
+        """
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "postgresql":
+            insert = postgresql.insert
+        elif dialect == "sqlite":
+            insert = sqlite.insert
+        else:
+            if await self.get_by_email(user.email):
+                return None
+            return await self.create(user)
+
+        values = {
+            key: user.__dict__[key]
+            for key in User._dict_columns
+            if key in user.__dict__
+        }
+        stmt = (
+            insert(User)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(User)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
     async def get_by_id(self, user_id: str) -> Optional[User]:
         """
         Get user by ID.
@@ -120,10 +160,28 @@ class RefreshTokenRepository:
         await self.db.refresh(refresh_token)
         return refresh_token
 
+    def add(self, refresh_token: RefreshToken) -> RefreshToken:
+        """
+        Stage a new refresh token without flushing.
+
+        The INSERT is sent with the session's next flush or commit, so it
+        can share a round trip with other pending changes.
+
+        Args:
+            refresh_token: RefreshToken instance to create
+
+        Returns:
+            Staged refresh token
+        """
+        self.db.add(refresh_token)
+        return refresh_token
+
     async def get_by_token(self, token: str) -> Optional[RefreshToken]:
         """
         Get refresh token by token string.
 
+        The lookup goes through the token's digest index.
+
         Args:
             token: Token string
 
@@ -131,7 +189,7 @@ class RefreshTokenRepository:
             RefreshToken or None if not found
         """
         result = await self.db.execute(
-            select(RefreshToken).where(RefreshToken.token == token)
+            select(RefreshToken).where(RefreshToken.token_hash == hash_token(token))
         )
         return result.scalar_one_or_none()
 
@@ -139,6 +197,8 @@ class RefreshTokenRepository:
         """
         Revoke a refresh token.
 
+        The change is written by the caller's next flush or commit.
+
         Args:
             refresh_token: RefreshToken to revoke
 
@@ -146,8 +206,6 @@ class RefreshTokenRepository:
             Revoked token
         """
         refresh_token.revoked = True
-        await self.db.flush()
-        await self.db.refresh(refresh_token)
         return refresh_token
 
     async def revoke_all_for_user(self, user_id: str) -> None:
@@ -172,21 +230,20 @@ class RefreshTokenRepository:
 
     async def delete_expired(self) -> int:
         """
-        Delete expired refresh tokens.
+        Delete expired and revoked refresh tokens.
+
+        Runs as a single DELETE backed by the expires_at index.
 
         Returns:
             Number of tokens deleted
         """
-        now = datetime.now(timezone.utc).isoformat()
+        now = datetime.now(timezone.utc)
 
         result = await self.db.execute(
-            select(RefreshToken).where(RefreshToken.expires_at < now)
+            delete(RefreshToken).where(
+                or_(RefreshToken.expires_at < now, RefreshToken.revoked == True)
+            )
         )
-        tokens = result.scalars().all()
-
-        count = len(tokens)
-        for token in tokens:
-            await self.db.delete(token)
 
         await self.db.flush()
-        return count
+        return result.rowcount
@@ -5,6 +5,7 @@ Async database session configuration.
 from collections.abc import AsyncGenerator
 from typing import Any
 
+import orjson
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -19,6 +20,11 @@ from app.core.logging import get_logger
 logger = get_logger(__name__)
 
 
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON column values with orjson."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 def get_engine_config() -> dict[str, Any]:
     """
     Get database engine configuration based on database type.
@@ -29,6 +35,11 @@ def get_engine_config() -> dict[str, Any]:
     config: dict[str, Any] = {
         "echo": settings.DEBUG,
         "future": True,
+        # Rows per multi-VALUES INSERT when flushing many new objects at once
+        "insertmanyvalues_page_size": 1000,
+        # JSON columns (collection schemas, options, metadata) go through orjson
+        "json_serializer": _json_serializer,
+        "json_deserializer": orjson.loads,
     }
 
     if settings.database_is_sqlite:
@@ -40,13 +51,22 @@ def get_engine_config() -> dict[str, Any]:
             "poolclass": StaticPool if settings.is_development else NullPool,
         })
     else:
-        # PostgreSQL/other databases
+        # PostgreSQL/other databases: keep a warm pool to skip per-request handshakes
         config.update({
             "pool_pre_ping": True,
-            "pool_size": 10,
-            "max_overflow": 20,
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
         })
 
+        if "asyncpg" in settings.DATABASE_URL.lower():
+            config["connect_args"] = {
+                # JIT compilation only slows down short OLTP queries
+                "server_settings": {"jit": "off"},
+                "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+                "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            }
+
     return config
 
 
@@ -111,6 +131,7 @@ async def init_db() -> None:
         await conn.run_sync(Base.metadata.create_all)
 
     logger.info("Database initialized successfully")
+    logger.info(f"Database pool: {engine.pool.status()}")
 
 
 async def close_db() -> None:
@@ -4,24 +4,42 @@ FastCMS - AI-Native Backend-as-a-Service
 Main FastAPI application entry point.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import Any, AsyncGenerator
 
+import orjson
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import settings
+from app.core.events import event_manager
 from app.core.exceptions import FastCMSException
 from app.core.logging import get_logger, setup_logging
-from app.db.session import close_db, init_db
+from app.db.repositories.user import RefreshTokenRepository
+from app.db.session import AsyncSessionLocal, close_db, init_db
 
 # Setup logging first
 setup_logging()
 logger = get_logger(__name__)
 
 
+async def prune_refresh_tokens() -> None:
+    """Periodically delete expired and revoked refresh tokens."""
+    while True:
+        await asyncio.sleep(settings.REFRESH_TOKEN_PRUNE_INTERVAL)
+        try:
+            async with AsyncSessionLocal() as session:
+                deleted = await RefreshTokenRepository(session).delete_expired()
+                await session.commit()
+            if deleted:
+                logger.info(f"Pruned {deleted} expired or revoked refresh tokens")
+        except Exception as e:
+            logger.error(f"Refresh token pruning failed: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
@@ -38,12 +56,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Initialize database
     await init_db()
 
+    prune_task = asyncio.create_task(prune_refresh_tokens())
+
     logger.info(f"{settings.APP_NAME} started successfully")
 
     yield
 
     # Shutdown
     logger.info(f"Shutting down {settings.APP_NAME}")
+    prune_task.cancel()
+    await event_manager.close()
     await close_db()
     logger.info("Shutdown complete")
 
@@ -55,18 +77,36 @@ app = FastAPI(
     description="AI-Native Backend-as-a-Service - Open-source FastAPI CMS",
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
+    # No schema route outside debug, so the OpenAPI document is never generated
+    openapi_url="/openapi.json" if settings.DEBUG else None,
     default_response_class=ORJSONResponse,  # Use orjson for performance
     lifespan=lifespan,
 )
 
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS,
-    allow_credentials=settings.CORS_ALLOW_CREDENTIALS,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Add CORS middleware (skipped when no origins are allowed, saving a frame per request)
+if settings.CORS_ORIGINS:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.CORS_ORIGINS,
+        allow_credentials=settings.CORS_ALLOW_CREDENTIALS,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+
+class ValidationErrorResponse(ORJSONResponse):
+    """ORJSONResponse that stringifies values orjson can't encode.
+
+    Validation error entries may carry raw objects such as the exception
+    raised by a validator in their ``ctx``.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
 
 
 # Exception handlers
@@ -74,7 +114,7 @@ app.add_middleware(
 async def fastcms_exception_handler(
     request: Request,
     exc: FastCMSException,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle custom FastCMS exceptions."""
     logger.error(
         f"FastCMS exception: {exc.message}",
@@ -84,7 +124,7 @@ async def fastcms_exception_handler(
             "path": request.url.path,
         },
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": exc.message,
@@ -97,20 +137,21 @@ async def fastcms_exception_handler(
 async def validation_exception_handler(
     request: Request,
     exc: RequestValidationError,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle Pydantic validation errors."""
+    errors = exc.errors()
     logger.warning(
         "Validation error",
         extra={
-            "errors": exc.errors(),
+            "errors": errors,
             "path": request.url.path,
         },
     )
-    return JSONResponse(
+    return ValidationErrorResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": "Validation failed",
-            "details": exc.errors(),
+            "details": errors,
         },
     )
 
@@ -119,13 +160,13 @@ async def validation_exception_handler(
 async def general_exception_handler(
     request: Request,
     exc: Exception,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle all other exceptions."""
     logger.exception(
         f"Unhandled exception: {str(exc)}",
         extra={"path": request.url.path},
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": "Internal server error",
@@ -5,10 +5,13 @@ Pydantic schemas for collection endpoints.
 from datetime import datetime
 from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from app.utils.field_types import FieldSchema
 
+# Allowed collection types
+CollectionType = Literal["base", "auth", "view"]
+
 
 class CollectionBase(BaseModel):
     """Base collection schema with common fields."""
@@ -21,7 +24,7 @@ class CollectionBase(BaseModel):
         description="Collection name (must be unique)",
     )
 
-    type: Literal["base", "auth", "view"] = Field(
+    type: CollectionType = Field(
         default="base",
         description="Collection type",
     )
@@ -119,8 +122,7 @@ class CollectionResponse(CollectionBase):
     created: datetime
     updated: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CollectionListResponse(BaseModel):
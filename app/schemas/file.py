@@ -1,7 +1,7 @@
 """File schemas for upload and response."""
 from datetime import datetime
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class FileUpload(BaseModel):
@@ -32,8 +32,7 @@ class FileResponse(BaseModel):
     updated: datetime
     url: Optional[str] = None  # Computed field for download URL
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class FileListResponse(BaseModel):
@@ -1,7 +1,7 @@
 """Record schemas for dynamic CRUD operations."""
 from datetime import datetime
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class RecordCreate(BaseModel):
@@ -17,6 +17,14 @@ class RecordCreate(BaseModel):
         return v
 
 
+class RecordBatchCreate(BaseModel):
+    """Schema for creating several records in one request."""
+
+    records: List[RecordCreate] = Field(
+        ..., min_length=1, max_length=1000, description="Records to create"
+    )
+
+
 class RecordUpdate(BaseModel):
     """Schema for updating a record in any collection."""
 
@@ -38,8 +46,7 @@ class RecordResponse(BaseModel):
     created: datetime
     updated: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class RecordListResponse(BaseModel):
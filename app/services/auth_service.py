@@ -2,7 +2,8 @@
 Business logic service for authentication operations.
 """
 
-import secrets
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Tuple
 
@@ -19,8 +20,10 @@ from app.core.security import (
     create_access_token,
     create_refresh_token,
     decode_token,
-    hash_password,
-    verify_password,
+    generate_token_key,
+    hash_password_async,
+    hash_token,
+    verify_password_async,
     verify_token_type,
 )
 from app.db.models.user import RefreshToken, User
@@ -37,6 +40,21 @@ from app.schemas.auth import (
 
 logger = get_logger(__name__)
 
+# User profiles served by get_user, keyed by user ID (LRU with a short TTL)
+USER_CACHE_TTL = 60  # seconds
+USER_CACHE_MAX_SIZE = 10000
+_user_cache: "OrderedDict[str, Tuple[float, UserResponse]]" = OrderedDict()
+
+
+def invalidate_user_cache(user_id: str) -> None:
+    """
+    Drop a user's cached profile after it changes.
+
+    Args:
+        user_id: User ID
+    """
+    _user_cache.pop(user_id, None)
+
 
 class AuthService:
     """Service for managing authentication."""
@@ -72,16 +90,11 @@ class AuthService:
         Raises:
             ConflictException: If email already exists
         """
-        # Check if user already exists
-        existing_user = await self.user_repo.get_by_email(data.email)
-        if existing_user:
-            raise ConflictException("User with this email already exists")
-
         # Hash password
-        password_hash = hash_password(data.password)
+        password_hash = await hash_password_async(data.password)
 
         # Generate token key for session invalidation
-        token_key = secrets.token_hex(32)
+        token_key = generate_token_key()
 
         # Create user
         user = User(
@@ -92,7 +105,10 @@ class AuthService:
             verified=False,  # Requires email verification
         )
 
-        user = await self.user_repo.create(user)
+        # Insert atomically; an existing email makes this a no-op
+        user = await self.user_repo.insert_if_absent(user)
+        if user is None:
+            raise ConflictException("User with this email already exists")
         await self.db.commit()
 
         logger.info(f"User registered: {user.email}")
@@ -135,7 +151,7 @@ class AuthService:
             raise UnauthorizedException("Invalid email or password")
 
         # Verify password
-        if not verify_password(data.password, user.password_hash):
+        if not await verify_password_async(data.password, user.password_hash):
             logger.warning(f"Failed login attempt for: {data.email}")
             raise UnauthorizedException("Invalid email or password")
 
@@ -186,7 +202,10 @@ class AuthService:
             raise UnauthorizedException("Refresh token revoked or not found")
 
         # Check expiry
-        expires_at = datetime.fromisoformat(token_record.expires_at)
+        expires_at = token_record.expires_at
+        if expires_at.tzinfo is None:
+            # SQLite hands back naive datetimes; values are stored in UTC
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
         if expires_at < datetime.now(timezone.utc):
             raise UnauthorizedException("Refresh token expired")
 
@@ -203,7 +222,7 @@ class AuthService:
 
         logger.info(f"Tokens refreshed for user: {user.email}")
 
-        # Revoke old refresh token (token rotation)
+        # Revoke old refresh token (token rotation); committed with the new token
         await self.token_repo.revoke(token_record)
 
         # Create new tokens
@@ -247,12 +266,25 @@ class AuthService:
         Raises:
             UnauthorizedException: If user not found
         """
+        cached = _user_cache.get(user_id)
+        if cached is not None:
+            expires, response = cached
+            if expires > time.monotonic():
+                _user_cache.move_to_end(user_id)
+                return response
+            _user_cache.pop(user_id, None)
+
         user = await self.user_repo.get_by_id(user_id)
 
         if not user:
             raise UnauthorizedException("User not found")
 
-        return self._to_user_response(user)
+        response = self._to_user_response(user)
+        _user_cache[user_id] = (time.monotonic() + USER_CACHE_TTL, response)
+        if len(_user_cache) > USER_CACHE_MAX_SIZE:
+            _user_cache.popitem(last=False)
+
+        return response
 
     async def update_user(
         self,
@@ -298,6 +330,7 @@ class AuthService:
 
         user = await self.user_repo.update(user)
         await self.db.commit()
+        invalidate_user_cache(user_id)
 
         logger.info(f"User updated: {user.email}")
 
@@ -324,21 +357,21 @@ class AuthService:
             raise UnauthorizedException("User not found")
 
         # Verify old password
-        if not verify_password(data.old_password, user.password_hash):
+        if not await verify_password_async(data.old_password, user.password_hash):
             raise UnauthorizedException("Incorrect password")
 
         # Hash new password
-        user.password_hash = hash_password(data.new_password)
+        user.password_hash = await hash_password_async(data.new_password)
 
         # Generate new token key to invalidate all sessions
-        user.token_key = secrets.token_hex(32)
+        user.token_key = generate_token_key()
 
         await self.user_repo.update(user)
-        await self.db.commit()
 
-        # Revoke all refresh tokens
+        # Revoke all refresh tokens in the same transaction
         await self.token_repo.revoke_all_for_user(user_id)
         await self.db.commit()
+        invalidate_user_cache(user_id)
 
         logger.info(f"Password changed for user: {user.email}")
 
@@ -377,12 +410,14 @@ class AuthService:
         refresh_token = RefreshToken(
             user_id=user.id,
             token=refresh_token_str,
-            expires_at=expires_at.isoformat(),
+            token_hash=hash_token(refresh_token_str),
+            expires_at=expires_at,
             user_agent=user_agent,
             ip_address=ip_address,
         )
 
-        await self.token_repo.create(refresh_token)
+        # Any staged changes (e.g. a rotated-out token) go out in the same commit
+        self.token_repo.add(refresh_token)
         await self.db.commit()
 
         return TokenResponse(
@@ -402,12 +437,7 @@ class AuthService:
         Returns:
             User response schema
         """
-        return UserResponse(
-            id=user.id,
-            email=user.email if user.email_visibility else "hidden",
-            verified=user.verified,
-            name=user.name,
-            avatar=user.avatar,
-            created=user.created,
-            updated=user.updated,
-        )
+        response = UserResponse.model_validate(user)
+        if not user.email_visibility:
+            response.email = "hidden"
+        return response
@@ -2,8 +2,11 @@
 Business logic service for collection operations.
 """
 
-from typing import List, Optional
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, NoReturn, Optional, Tuple
 
+from pydantic import TypeAdapter, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import BadRequestException, ConflictException, NotFoundException
@@ -15,12 +18,60 @@ from app.db.session import engine
 from app.schemas.collection import (
     CollectionCreate,
     CollectionResponse,
+    CollectionType,
     CollectionUpdate,
 )
 from app.utils.field_types import FieldSchema
 
 logger = get_logger(__name__)
 
+# Parsed field schemas per collection name (LRU with a TTL so other
+# workers' schema changes are picked up). The cache is per worker: after
+# another worker deletes a collection this one may keep serving it for up to
+# the TTL, until RecordRepository hits the dropped table, evicts the model
+# and answers 404; an entry whose model is gone is dropped on lookup.
+SCHEMA_CACHE_TTL = 300  # seconds
+SCHEMA_CACHE_MAX_SIZE = 1024
+_schema_cache: "OrderedDict[str, Tuple[float, List[FieldSchema]]]" = OrderedDict()
+
+
+# Dumps a whole schema in one pydantic-core call
+_SCHEMA_ADAPTER = TypeAdapter(List[FieldSchema])
+
+# Checks the one response field whose stored value is not free-form
+_TYPE_ADAPTER: TypeAdapter[CollectionType] = TypeAdapter(CollectionType)
+
+
+def _changed_values(collection: Collection, values: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Keep only the values that differ from what a collection already stores.
+
+    Args:
+        collection: Stored collection
+        values: Column values to set
+
+    Returns:
+        Values that would actually change the row
+    """
+    return {
+        column: value
+        for column, value in values.items()
+        if getattr(collection, column) != value
+    }
+
+
+def invalidate_schema_cache(name: Optional[str] = None) -> None:
+    """
+    Drop cached field schemas after a collection changes.
+
+    Args:
+        name: Collection name, or None to clear every entry
+    """
+    if name:
+        _schema_cache.pop(name, None)
+    else:
+        _schema_cache.clear()
+
 
 class CollectionService:
     """Service for managing collections."""
@@ -57,7 +108,7 @@ class CollectionService:
             raise ConflictException(f"Collection '{data.name}' already exists")
 
         # Convert schema to dict for storage
-        schema_dict = [field.model_dump() for field in data.schema]
+        schema_dict = _SCHEMA_ADAPTER.dump_python(data.schema)
 
         # Create collection record
         collection = Collection(
@@ -75,9 +126,6 @@ class CollectionService:
 
         # Save to database
         collection = await self.repo.create(collection)
-        await self.db.commit()
-
-        logger.info(f"Collection '{data.name}' created with ID: {collection.id}")
 
         # Create dynamic model and table
         try:
@@ -86,16 +134,21 @@ class CollectionService:
                 fields=data.schema,
             )
 
-            await DynamicModelGenerator.create_table(engine, model)
-
-            logger.info(f"Database table '{data.name}' created successfully")
+            # DDL joins the collection insert's transaction on the session's connection
+            await DynamicModelGenerator.create_table(await self.db.connection(), model)
 
         except Exception as e:
             # Rollback collection creation if table creation fails
             await self.db.rollback()
+            DynamicModelGenerator.clear_cache(data.name)
             logger.error(f"Failed to create table for collection '{data.name}': {e}")
             raise BadRequestException(f"Failed to create collection table: {str(e)}")
 
+        await self.db.commit()
+
+        logger.info(f"Collection '{data.name}' created with ID: {collection.id}")
+        logger.info(f"Database table '{data.name}' created successfully")
+
         return self._to_response(collection)
 
     async def get_collection(self, collection_id: str) -> CollectionResponse:
@@ -138,6 +191,50 @@ class CollectionService:
 
         return self._to_response(collection)
 
+    async def get_field_schemas(self, name: str) -> List[FieldSchema]:
+        """
+        Get a collection's parsed field schemas, cached by name.
+
+        On a cache miss the collection row is loaded, its fields are parsed
+        once and its dynamic model is registered, so record operations need
+        neither a collection query nor per-request schema parsing.
+
+        Args:
+            name: Collection name
+
+        Returns:
+            Field schemas of the collection
+
+        Raises:
+            NotFoundException: If collection not found
+            BadRequestException: If the stored schema no longer parses
+        """
+        cached = _schema_cache.get(name)
+        if cached is not None:
+            expires, fields = cached
+            # The model is evicted when its table turns out to be gone
+            if expires > time.monotonic() and DynamicModelGenerator.get_model(name):
+                _schema_cache.move_to_end(name)
+                return fields
+            _schema_cache.pop(name, None)
+
+        collection = await self.repo.get_by_name(name)
+        if not collection:
+            raise NotFoundException(f"Collection '{name}' not found")
+
+        try:
+            fields = _SCHEMA_ADAPTER.validate_python(collection.schema.get("fields", []))
+        except ValidationError as e:
+            # Rows stored before stricter field rules (e.g. regex checks) existed
+            raise BadRequestException(f"Collection '{name}' has an invalid schema: {e}") from e
+        DynamicModelGenerator.create_model(collection_name=name, fields=fields)
+
+        _schema_cache[name] = (time.monotonic() + SCHEMA_CACHE_TTL, fields)
+        if len(_schema_cache) > SCHEMA_CACHE_MAX_SIZE:
+            _schema_cache.popitem(last=False)
+
+        return fields
+
     async def list_collections(
         self,
         page: int = 1,
@@ -157,14 +254,12 @@ class CollectionService:
         """
         skip = (page - 1) * per_page
 
-        collections = await self.repo.get_all(
+        collections, total = await self.repo.get_page(
             skip=skip,
             limit=per_page,
             include_system=include_system,
         )
 
-        total = await self.repo.count(include_system=include_system)
-
         return [self._to_response(c) for c in collections], total
 
     async def update_collection(
@@ -186,50 +281,58 @@ class CollectionService:
             NotFoundException: If collection not found
             BadRequestException: If update fails
         """
-        collection = await self.repo.get_by_id(collection_id)
-
-        if not collection:
-            raise NotFoundException(f"Collection with ID '{collection_id}' not found")
-
-        if collection.system:
-            raise BadRequestException("Cannot modify system collection")
-
-        # Update fields
-        if data.name is not None:
-            # Check name uniqueness
-            if data.name != collection.name and await self.repo.exists(data.name):
-                raise ConflictException(f"Collection '{data.name}' already exists")
-            collection.name = data.name
-
+        # Collect changed columns
+        values = {
+            column: getattr(data, column)
+            for column in (
+                "name", "options", "list_rule", "view_rule",
+                "create_rule", "update_rule", "delete_rule",
+            )
+            if getattr(data, column) is not None
+        }
         if data.schema is not None:
-            collection.schema = {"fields": [field.model_dump() for field in data.schema]}
+            values["schema"] = {"fields": _SCHEMA_ADAPTER.dump_python(data.schema)}
 
-        if data.options is not None:
-            collection.options = data.options
-
-        if data.list_rule is not None:
-            collection.list_rule = data.list_rule
-
-        if data.view_rule is not None:
-            collection.view_rule = data.view_rule
-
-        if data.create_rule is not None:
-            collection.create_rule = data.create_rule
+        # Check name uniqueness
+        if data.name is not None and await self.repo.name_taken(data.name, collection_id):
+            raise ConflictException(f"Collection '{data.name}' already exists")
 
-        if data.update_rule is not None:
-            collection.update_rule = data.update_rule
+        current = None
+        if data.schema is not None or data.name is not None:
+            # Schema and name changes read the stored row, so an unchanged schema
+            # is not rewritten and caches can be evicted under the previous name
+            current = await self.repo.get_by_id(collection_id)
+            if not current or current.system:
+                await self._raise_not_modifiable(collection_id, "modify")
+            values = _changed_values(current, values)
+        old_name = current.name if current else None
+
+        if values:
+            if current:
+                # Let RETURNING build a fresh instance instead of leaving this one stale
+                self.db.expunge(current)
+                current = None
+            # Single UPDATE ... RETURNING
+            collection = await self.repo.update_by_id(collection_id, values)
+        else:
+            collection = current or await self.repo.get_by_id(collection_id)
+            if collection and collection.system:
+                collection = None
 
-        if data.delete_rule is not None:
-            collection.delete_rule = data.delete_rule
+        if not collection:
+            await self._raise_not_modifiable(collection_id, "modify")
 
-        collection = await self.repo.update(collection)
         await self.db.commit()
 
         logger.info(f"Collection '{collection.name}' updated")
 
         # TODO: Handle schema changes (add/remove columns)
-        # For now, we'll just clear the model cache
-        DynamicModelGenerator.clear_cache(collection.name)
+        # For now, we'll just clear the model cache. Options and rules are not
+        # part of the cached model or field schemas, so leave those warm.
+        if "name" in values or "schema" in values:
+            for name in {old_name, collection.name}:
+                DynamicModelGenerator.clear_cache(name)
+                invalidate_schema_cache(name)
 
         return self._to_response(collection)
 
@@ -244,33 +347,48 @@ class CollectionService:
             NotFoundException: If collection not found
             BadRequestException: If trying to delete system collection
         """
-        collection = await self.repo.get_by_id(collection_id)
-
-        if not collection:
-            raise NotFoundException(f"Collection with ID '{collection_id}' not found")
+        # Single DELETE ... RETURNING instead of loading the row first
+        name = await self.repo.delete_by_id(collection_id)
+        if name is None:
+            await self._raise_not_modifiable(collection_id, "delete")
 
-        if collection.system:
-            raise BadRequestException("Cannot delete system collection")
+        await self.db.commit()
+        invalidate_schema_cache(name)
 
         # Drop database table
         try:
-            model = DynamicModelGenerator.get_model(collection.name)
+            model = DynamicModelGenerator.get_model(name)
             if model:
                 await DynamicModelGenerator.drop_table(engine, model)
-                logger.info(f"Database table '{collection.name}' dropped")
+                logger.info(f"Database table '{name}' dropped")
 
             # Clear cache
-            DynamicModelGenerator.clear_cache(collection.name)
+            DynamicModelGenerator.clear_cache(name)
 
         except Exception as e:
-            logger.warning(f"Failed to drop table '{collection.name}': {e}")
-            # Continue with collection deletion even if table drop fails
+            logger.warning(f"Failed to drop table '{name}': {e}")
+            # The collection is already deleted even if the table drop fails
 
-        # Delete collection record
-        await self.repo.delete(collection)
-        await self.db.commit()
+        logger.info(f"Collection '{name}' deleted")
+
+    async def _raise_not_modifiable(self, collection_id: str, action: str) -> NoReturn:
+        """
+        Raise the error for a write that matched no modifiable collection.
 
-        logger.info(f"Collection '{collection.name}' deleted")
+        Only runs on the failure path, to tell a missing collection from a
+        system one.
+
+        Args:
+            collection_id: Collection ID
+            action: Attempted action for the error message
+
+        Raises:
+            NotFoundException: If collection not found
+            BadRequestException: If the collection is a system collection
+        """
+        if await self.repo.get_by_id(collection_id) is None:
+            raise NotFoundException(f"Collection with ID '{collection_id}' not found")
+        raise BadRequestException(f"Cannot {action} system collection")
 
     def _to_response(self, collection: Collection) -> CollectionResponse:
         """
@@ -283,15 +401,13 @@ class CollectionService:
             Collection response schema
         """
         # Parse schema from JSON
-        fields = [
-            FieldSchema(**field_data)
-            for field_data in collection.schema.get("fields", [])
-        ]
+        fields = _SCHEMA_ADAPTER.validate_python(collection.schema.get("fields", []))
 
-        return CollectionResponse(
+        # Row data is trusted, so skip re-validating the response (except the type)
+        return CollectionResponse.model_construct(
             id=collection.id,
             name=collection.name,
-            type=collection.type,
+            type=_TYPE_ADAPTER.validate_python(collection.type),
             schema=fields,
             options=collection.options,
             list_rule=collection.list_rule,
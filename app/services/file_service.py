@@ -1,9 +1,12 @@
 """Service for file upload, download, and management."""
+import asyncio
+import io
 import os
+import shutil
+import time
 import uuid
-import math
 from pathlib import Path
-from typing import Optional, BinaryIO
+from typing import List, Optional, BinaryIO
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.repositories.file import FileRepository
@@ -15,6 +18,19 @@ from app.core.exceptions import (
     ValidationException,
 )
 
+# Chunk size for copying uploads to disk when sendfile is unavailable
+UPLOAD_COPY_BUFFER_SIZE = 1024 * 1024
+
+# File columns copied into FileResponse (url is computed)
+_FILE_RESPONSE_FIELDS = tuple(name for name in FileResponse.model_fields if name != "url")
+
+
+def _is_in_memory(stream: BinaryIO) -> bool:
+    """Return True if the stream (or the buffer a spooled file wraps) lives in memory."""
+    # Spooled files expose no public rollover flag; fall back to the stream itself
+    buffer = getattr(stream, "_file", stream)
+    return isinstance(buffer, (io.BytesIO, io.StringIO))
+
 
 class FileService:
     """Service for managing file uploads and downloads."""
@@ -22,11 +38,9 @@ class FileService:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.repo = FileRepository(db)
+        # Created on first upload, which makes any missing parent directories
         self.storage_path = Path(settings.LOCAL_STORAGE_PATH)
 
-        # Ensure storage directory exists
-        self.storage_path.mkdir(parents=True, exist_ok=True)
-
     async def upload_file(
         self,
         file_content: BinaryIO,
@@ -57,13 +71,9 @@ class FileService:
         relative_path = self._get_storage_path(unique_filename)
         full_path = self.storage_path / relative_path
 
-        # Ensure parent directory exists
-        full_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write file to disk
+        # Stream file to disk off the event loop
         try:
-            with open(full_path, "wb") as f:
-                f.write(file_content.read())
+            await asyncio.to_thread(self._write_file, file_content, full_path)
         except Exception as e:
             raise BadRequestException(f"Failed to save file: {str(e)}")
 
@@ -107,7 +117,7 @@ class FileService:
 
         file_path = self.storage_path / file.storage_path
 
-        if not file_path.exists():
+        if not await asyncio.to_thread(file_path.exists):
             raise NotFoundException(f"File content not found on disk")
 
         return file_path, file.original_filename, file.mime_type
@@ -123,21 +133,16 @@ class FileService:
         """List files with pagination and filtering."""
         skip = (page - 1) * per_page
 
-        files = await self.repo.get_all(
+        files, total = await self.repo.get_page(
             skip=skip,
             limit=per_page,
             collection_name=collection_name,
             record_id=record_id,
             user_id=user_id,
         )
-        total = await self.repo.count(
-            collection_name=collection_name,
-            record_id=record_id,
-            user_id=user_id,
-        )
 
         items = [self._to_response(file) for file in files]
-        total_pages = math.ceil(total / per_page) if total > 0 else 0
+        total_pages = (total + per_page - 1) // per_page
 
         return FileListResponse(
             items=items,
@@ -156,57 +161,71 @@ class FileService:
         # Soft delete in database
         await self.repo.soft_delete(file_id)
 
-        # Delete physical file
-        file_path = self.storage_path / file.storage_path
-        if file_path.exists():
-            try:
-                file_path.unlink()
-            except Exception as e:
-                # Log error but don't fail the request
-                pass
-
-        # Delete thumbnails if any
+        # Soft delete thumbnails if any
         thumbnails = await self.repo.get_thumbnails(file_id)
         for thumb in thumbnails:
-            thumb_path = self.storage_path / thumb.storage_path
-            if thumb_path.exists():
-                try:
-                    thumb_path.unlink()
-                except Exception:
-                    pass
             await self.repo.soft_delete(thumb.id)
 
+        # Delete physical files off the event loop
+        await asyncio.to_thread(
+            self._delete_files,
+            [self.storage_path / file.storage_path]
+            + [self.storage_path / thumb.storage_path for thumb in thumbnails],
+        )
+
         await self.db.commit()
 
-    def _get_storage_path(self, filename: str) -> str:
-        """Generate storage path with date-based organization."""
-        from datetime import datetime
+    def _write_file(self, file_content: BinaryIO, full_path: Path) -> None:
+        """Copy an upload to disk in bounded chunks (runs in a worker thread)."""
+        # Ensure parent directory exists
+        full_path.parent.mkdir(parents=True, exist_ok=True)
 
-        now = datetime.utcnow()
-        year = now.strftime("%Y")
-        month = now.strftime("%m")
-        day = now.strftime("%d")
+        with open(full_path, "wb") as f:
+            if not self._sendfile(file_content, f):
+                shutil.copyfileobj(file_content, f, UPLOAD_COPY_BUFFER_SIZE)
+
+    def _delete_files(self, paths: List[Path]) -> None:
+        """Remove files from disk, ignoring failures (runs in a worker thread)."""
+        for path in paths:
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                # Log error but don't fail the request
+                pass
 
-        return f"{year}/{month}/{day}/{filename}"
+    def _sendfile(self, file_content: BinaryIO, f: BinaryIO) -> bool:
+        """Copy a disk-backed upload with os.sendfile; returns False if not possible."""
+        # Asking an in-memory spooled file for its fileno would spill it to disk
+        if _is_in_memory(file_content):
+            return False
+
+        try:
+            src = file_content.fileno()
+            offset = start = file_content.tell()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            return False
+
+        try:
+            while sent := os.sendfile(f.fileno(), src, offset, UPLOAD_COPY_BUFFER_SIZE):
+                offset += sent
+        except OSError:
+            # Start over with a plain copy
+            f.seek(0)
+            f.truncate()
+            file_content.seek(start)
+            return False
+
+        file_content.seek(offset)
+        return True
+
+    def _get_storage_path(self, filename: str) -> str:
+        """Generate storage path with date-based organization."""
+        now = time.gmtime()
+        return f"{now.tm_year:04d}/{now.tm_mon:02d}/{now.tm_mday:02d}/{filename}"
 
     def _to_response(self, file) -> FileResponse:
         """Convert file model to response schema."""
-        response = FileResponse(
-            id=file.id,
-            filename=file.filename,
-            original_filename=file.original_filename,
-            mime_type=file.mime_type,
-            size=file.size,
-            storage_path=file.storage_path,
-            storage_type=file.storage_type,
-            collection_name=file.collection_name,
-            record_id=file.record_id,
-            field_name=file.field_name,
-            user_id=file.user_id,
-            is_thumbnail=file.is_thumbnail,
-            parent_file_id=file.parent_file_id,
-            created=file.created,
-            updated=file.updated,
-            url=f"/api/v1/files/{file.id}/download",
-        )
-        return response
+        # Row data is trusted, so skip re-validating the response
+        data = {name: getattr(file, name) for name in _FILE_RESPONSE_FIELDS}
+        data["url"] = f"/api/v1/files/{file.id}/download"
+        return FileResponse.model_construct(**data)
@@ -1,13 +1,24 @@
 """Service for record CRUD operations with validation."""
-import math
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from typing import Annotated, Any, Callable, Dict, List, Optional, Tuple, Union, cast
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 
+from pydantic import (
+    AfterValidator,
+    Field,
+    StrictBool,
+    StrictStr,
+    TypeAdapter,
+    ValidationError,
+)
+from typing_extensions import NotRequired, Required, TypedDict
+
 from app.db.repositories.record import RecordRepository
-from app.db.repositories.collection import CollectionRepository
+from app.services.collection_service import SCHEMA_CACHE_MAX_SIZE, CollectionService
 from app.schemas.record import (
     RecordCreate,
+    RecordBatchCreate,
     RecordUpdate,
     RecordResponse,
     RecordListResponse,
@@ -22,6 +33,159 @@ from app.core.exceptions import (
 from app.core.events import event_manager, Event, EventType
 
 
+def _check_pattern(value: str, field_schema: FieldSchema) -> str:
+    """Check a text value against the field's compiled pattern."""
+    pattern = field_schema.validation._compiled_pattern
+    if pattern is not None and not pattern.match(value):
+        raise ValueError("Does not match required pattern")
+    return value
+
+
+def _validate_email(value: str, field_schema: FieldSchema) -> str:
+    """Validate an email value."""
+    # Basic email validation: a local part, then a dot somewhere after the "@"
+    at = value.find("@")
+    if at <= 0 or value.find(".", at) < 0:
+        raise ValueError("Invalid email format")
+    return value
+
+
+def _validate_url(value: str, field_schema: FieldSchema) -> str:
+    """Validate a URL value."""
+    if not value.startswith(("http://", "https://")):
+        raise ValueError("Invalid URL format")
+    return value
+
+
+def _validate_date(value: Any, field_schema: FieldSchema) -> Any:
+    """Validate a date value."""
+    if isinstance(value, str):
+        try:
+            datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            raise ValueError("Invalid date format") from None
+    elif not isinstance(value, datetime):
+        raise ValueError("Must be a date string or datetime")
+    return value
+
+
+def _validate_number(value: Any, field_schema: FieldSchema) -> Any:
+    """Validate a number value."""
+    # Booleans are ints, and have always been accepted as numbers
+    if not isinstance(value, (int, float)):
+        raise ValueError("Must be a number")
+    validation = field_schema.validation
+    if validation.min is not None and value < validation.min:
+        raise ValueError(f"Minimum value is {validation.min}")
+    if validation.max is not None and value > validation.max:
+        raise ValueError(f"Maximum value is {validation.max}")
+    return value
+
+
+def _validate_select(value: Any, field_schema: FieldSchema) -> Any:
+    """Validate a select value."""
+    values = field_schema.validation.values
+    if values and value not in values:
+        raise ValueError(f"Must be one of: {', '.join(values)}")
+    return value
+
+
+def _validate_relation(value: Any, field_schema: FieldSchema) -> Any:
+    """Validate a relation value."""
+    if not isinstance(value, str):
+        raise ValueError("Must be a string (record ID)")
+    return value
+
+
+def _check(validator: Callable[[Any, FieldSchema], Any], field_schema: FieldSchema) -> AfterValidator:
+    """Bind a Python value check to a field as a pydantic after-validator."""
+    return AfterValidator(lambda value: validator(value, field_schema))
+
+
+def _text_type(field_schema: FieldSchema) -> Any:
+    """Annotated type for text and editor fields."""
+    validation = field_schema.validation
+    constraints = [
+        Field(
+            min_length=validation.min_length or None,
+            max_length=validation.max_length or None,
+        )
+    ]
+    if validation.pattern:
+        constraints.append(_check(_check_pattern, field_schema))
+    return Annotated[(StrictStr, *constraints)]
+
+
+# Field type -> builder of the pydantic type used to validate its values
+# (types not listed accept any value)
+_FIELD_TYPES: Dict[FieldType, Callable[[FieldSchema], Any]] = {
+    FieldType.TEXT: _text_type,
+    FieldType.EDITOR: _text_type,
+    FieldType.NUMBER: lambda field_schema: Annotated[Any, _check(_validate_number, field_schema)],
+    FieldType.BOOL: lambda field_schema: StrictBool,
+    FieldType.EMAIL: lambda field_schema: Annotated[StrictStr, _check(_validate_email, field_schema)],
+    FieldType.URL: lambda field_schema: Annotated[StrictStr, _check(_validate_url, field_schema)],
+    FieldType.DATE: lambda field_schema: Annotated[Any, _check(_validate_date, field_schema)],
+    FieldType.SELECT: lambda field_schema: Annotated[Any, _check(_validate_select, field_schema)],
+    FieldType.RELATION: lambda field_schema: Annotated[Any, _check(_validate_relation, field_schema)],
+    FieldType.FILE: lambda field_schema: list,
+}
+
+# Validates one collection's record data
+RecordAdapter = TypeAdapter[Dict[str, Any]]
+
+# pydantic error type -> API error message, matching the field messages clients see
+_ERROR_MESSAGES: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "missing": lambda ctx: "This field is required",
+    "string_type": lambda ctx: "Must be a string",
+    "string_too_short": lambda ctx: f"Minimum length is {ctx['min_length']}",
+    "string_too_long": lambda ctx: f"Maximum length is {ctx['max_length']}",
+    "bool_type": lambda ctx: "Must be a boolean",
+    "list_type": lambda ctx: "Must be an array of file IDs",
+    "value_error": lambda ctx: str(ctx["error"]),
+}
+
+
+def _build_adapter(name: str, field_schemas: List[FieldSchema], is_create: bool) -> RecordAdapter:
+    """Build a TypedDict adapter validating a record's data for one collection."""
+    annotations: Dict[str, Any] = {}
+    for field_schema in field_schemas:
+        builder = _FIELD_TYPES.get(field_schema.type)
+        field_type = builder(field_schema) if builder else Any
+        if not field_schema.validation.required:
+            field_type = Optional[field_type]
+        # Required fields must be present on create; updates are partial
+        wrapper = Required if is_create and field_schema.validation.required else NotRequired
+        annotations[field_schema.name] = wrapper[field_type]
+    # The functional TypedDict form, called with a computed name and fields
+    record_type = cast(Callable[..., Any], TypedDict)(f"{name}_record", annotations)
+    return TypeAdapter(record_type)
+
+
+# Record data adapters per collection: (field schemas, create adapter, update adapter).
+# Rebuilt whenever the schema cache hands out a new field list.
+_adapter_cache: "OrderedDict[str, Tuple[List[FieldSchema], RecordAdapter, RecordAdapter]]" = (
+    OrderedDict()
+)
+
+
+def _get_adapters(
+    name: str, field_schemas: List[FieldSchema]
+) -> Tuple[RecordAdapter, RecordAdapter]:
+    """Get the cached create and update adapters for a collection's schema."""
+    cached = _adapter_cache.get(name)
+    if cached is not None and cached[0] is field_schemas:
+        _adapter_cache.move_to_end(name)
+        return cached[1], cached[2]
+
+    create = _build_adapter(name, field_schemas, is_create=True)
+    update = _build_adapter(name, field_schemas, is_create=False)
+    _adapter_cache[name] = (field_schemas, create, update)
+    _adapter_cache.move_to_end(name)
+    if len(_adapter_cache) > SCHEMA_CACHE_MAX_SIZE:
+        _adapter_cache.popitem(last=False)
+    return create, update
+
 class RecordService:
     """Service for managing records in dynamic collections."""
 
@@ -29,18 +193,12 @@ class RecordService:
         self.db = db
         self.collection_name = collection_name
         self.repo = RecordRepository(db, collection_name)
-        self.collection_repo = CollectionRepository(db)
+        self.collection_service = CollectionService(db)
 
     async def create_record(self, data: RecordCreate) -> RecordResponse:
         """Create a new record with validation."""
-        # Get collection schema
-        collection = await self.collection_repo.get_by_name(self.collection_name)
-        if not collection:
-            raise NotFoundException(f"Collection '{self.collection_name}' not found")
-
-        # Extract fields from schema
-        fields = collection.schema.get("fields", [])
-        field_schemas = [FieldSchema(**field) for field in fields]
+        # Get collection schema (cached)
+        field_schemas = await self.collection_service.get_field_schemas(self.collection_name)
 
         # Validate data against schema
         validated_data = self._validate_fields(data.data, field_schemas, is_create=True)
@@ -51,19 +209,59 @@ class RecordService:
 
         # Broadcast event
         response = self._to_response(record)
-        await event_manager.broadcast(
-            Event(
-                event_type=EventType.RECORD_CREATED,
-                collection_name=self.collection_name,
-                record_id=record.id,
-                data=response.data,
+        if event_manager.has_subscribers(self.collection_name):
+            await event_manager.broadcast(
+                Event(
+                    event_type=EventType.RECORD_CREATED,
+                    collection_name=self.collection_name,
+                    record_id=record.id,
+                    data=response.data,
+                )
             )
-        )
 
         return response
 
+    async def create_records(self, data: RecordBatchCreate) -> List[RecordResponse]:
+        """Create several records with one INSERT and one commit."""
+        # Get collection schema (cached)
+        field_schemas = await self.collection_service.get_field_schemas(self.collection_name)
+
+        # Validate every row before writing any of them
+        rows = []
+        errors = {}
+        for index, record_data in enumerate(data.records):
+            try:
+                rows.append(self._validate_fields(record_data.data, field_schemas, is_create=True))
+            except ValidationException as e:
+                errors[index] = e.details["fields"]
+
+        if errors:
+            raise ValidationException("Validation failed", details={"records": errors})
+
+        # Create records
+        records = await self.repo.create_many(rows)
+        await self.db.commit()
+
+        # Broadcast events
+        responses = [self._to_response(record) for record in records]
+        if event_manager.has_subscribers(self.collection_name):
+            for response in responses:
+                await event_manager.broadcast(
+                    Event(
+                        event_type=EventType.RECORD_CREATED,
+                        collection_name=self.collection_name,
+                        record_id=response.id,
+                        data=response.data,
+                    )
+                )
+
+        return responses
+
     async def get_record(self, record_id: str) -> RecordResponse:
         """Get a record by ID."""
+        # Ensures the collection exists and its model is registered (cached)
+        await self.collection_service.get_field_schemas(self.collection_name)
+
         record = await self.repo.get_by_id(record_id)
         if not record:
             raise NotFoundException(f"Record '{record_id}' not found")
@@ -79,25 +277,22 @@ class RecordService:
         order: str = "asc",
     ) -> RecordListResponse:
         """List records with pagination, filtering, and sorting."""
-        # Validate collection exists
-        collection = await self.collection_repo.get_by_name(self.collection_name)
-        if not collection:
-            raise NotFoundException(f"Collection '{self.collection_name}' not found")
+        # Validate collection exists (cached)
+        await self.collection_service.get_field_schemas(self.collection_name)
 
         skip = (page - 1) * per_page
 
         # Get records and total count
-        records = await self.repo.get_all(
+        records, total = await self.repo.get_page(
             skip=skip,
             limit=per_page,
             filters=filters,
             sort_field=sort,
             sort_order=order,
         )
-        total = await self.repo.count(filters=filters)
 
         items = [self._to_response(record) for record in records]
-        total_pages = math.ceil(total / per_page) if total > 0 else 0
+        total_pages = (total + per_page - 1) // per_page
 
         return RecordListResponse(
             items=items,
@@ -109,46 +304,36 @@ class RecordService:
 
     async def update_record(self, record_id: str, data: RecordUpdate) -> RecordResponse:
         """Update a record with validation."""
-        # Check if record exists
-        existing = await self.repo.get_by_id(record_id)
-        if not existing:
-            raise NotFoundException(f"Record '{record_id}' not found")
-
-        # Get collection schema
-        collection = await self.collection_repo.get_by_name(self.collection_name)
-        if not collection:
-            raise NotFoundException(f"Collection '{self.collection_name}' not found")
-
-        # Extract fields from schema
-        fields = collection.schema.get("fields", [])
-        field_schemas = [FieldSchema(**field) for field in fields]
+        # Get collection schema (cached)
+        field_schemas = await self.collection_service.get_field_schemas(self.collection_name)
 
         # Validate data against schema
         validated_data = self._validate_fields(data.data, field_schemas, is_create=False)
 
-        # Update record
+        # Update record (no row returned means it does not exist)
         updated_record = await self.repo.update(record_id, validated_data)
+        if not updated_record:
+            raise NotFoundException(f"Record '{record_id}' not found")
         await self.db.commit()
 
         # Broadcast event
         response = self._to_response(updated_record)
-        await event_manager.broadcast(
-            Event(
-                event_type=EventType.RECORD_UPDATED,
-                collection_name=self.collection_name,
-                record_id=updated_record.id,
-                data=response.data,
+        if event_manager.has_subscribers(self.collection_name):
+            await event_manager.broadcast(
+                Event(
+                    event_type=EventType.RECORD_UPDATED,
+                    collection_name=self.collection_name,
+                    record_id=updated_record.id,
+                    data=response.data,
+                )
             )
-        )
 
         return response
 
     async def delete_record(self, record_id: str) -> None:
         """Delete a record."""
-        # Get record before deleting
-        record = await self.repo.get_by_id(record_id)
-        if not record:
-            raise NotFoundException(f"Record '{record_id}' not found")
+        # Ensures the collection exists and its model is registered (cached)
+        await self.collection_service.get_field_schemas(self.collection_name)
 
         # Delete record
         success = await self.repo.delete(record_id)
@@ -158,142 +343,43 @@ class RecordService:
         await self.db.commit()
 
         # Broadcast event
-        await event_manager.broadcast(
-            Event(
-                event_type=EventType.RECORD_DELETED,
-                collection_name=self.collection_name,
-                record_id=record_id,
-                data={"id": record_id},
+        if event_manager.has_subscribers(self.collection_name):
+            await event_manager.broadcast(
+                Event(
+                    event_type=EventType.RECORD_DELETED,
+                    collection_name=self.collection_name,
+                    record_id=record_id,
+                    data={"id": record_id},
+                )
             )
-        )
 
     def _validate_fields(
         self, data: Dict[str, Any], field_schemas: List[FieldSchema], is_create: bool
     ) -> Dict[str, Any]:
         """Validate record data against collection schema."""
-        validated = {}
-        errors = {}
-
-        # Check required fields (only on create)
-        if is_create:
-            for field_schema in field_schemas:
-                if field_schema.validation.required and field_schema.name not in data:
-                    errors[field_schema.name] = "This field is required"
-
-        # Validate provided fields
-        for field_name, value in data.items():
-            # Find field schema
-            field_schema = next(
-                (f for f in field_schemas if f.name == field_name), None
-            )
-
-            if not field_schema:
-                # Ignore unknown fields
-                continue
-
-            # Skip validation if value is None and field is not required
-            if value is None and not field_schema.validation.required:
-                validated[field_name] = None
-                continue
-
-            # Validate field
-            try:
-                validated_value = self._validate_field(value, field_schema)
-                validated[field_name] = validated_value
-            except ValueError as e:
-                errors[field_name] = str(e)
-
-        if errors:
-            raise ValidationException("Validation failed", details={"fields": errors})
-
-        return validated
-
-    def _validate_field(self, value: Any, field_schema: FieldSchema) -> Any:
-        """Validate a single field value."""
-        validation = field_schema.validation
-
-        # Type-specific validation
-        if field_schema.type == FieldType.TEXT or field_schema.type == FieldType.EDITOR:
-            if not isinstance(value, str):
-                raise ValueError("Must be a string")
-
-            if validation.min_length and len(value) < validation.min_length:
-                raise ValueError(f"Minimum length is {validation.min_length}")
-
-            if validation.max_length and len(value) > validation.max_length:
-                raise ValueError(f"Maximum length is {validation.max_length}")
-
-            if validation.pattern:
-                import re
-                if not re.match(validation.pattern, value):
-                    raise ValueError("Does not match required pattern")
-
-        elif field_schema.type == FieldType.NUMBER:
-            if not isinstance(value, (int, float)):
-                raise ValueError("Must be a number")
-
-            if validation.min is not None and value < validation.min:
-                raise ValueError(f"Minimum value is {validation.min}")
-
-            if validation.max is not None and value > validation.max:
-                raise ValueError(f"Maximum value is {validation.max}")
-
-        elif field_schema.type == FieldType.BOOL:
-            if not isinstance(value, bool):
-                raise ValueError("Must be a boolean")
-
-        elif field_schema.type == FieldType.EMAIL:
-            if not isinstance(value, str):
-                raise ValueError("Must be a string")
-            # Basic email validation
-            if "@" not in value or "." not in value:
-                raise ValueError("Invalid email format")
-
-        elif field_schema.type == FieldType.URL:
-            if not isinstance(value, str):
-                raise ValueError("Must be a string")
-            if not value.startswith(("http://", "https://")):
-                raise ValueError("Invalid URL format")
-
-        elif field_schema.type == FieldType.DATE:
-            if isinstance(value, str):
-                try:
-                    datetime.fromisoformat(value.replace("Z", "+00:00"))
-                except ValueError:
-                    raise ValueError("Invalid date format")
-            elif not isinstance(value, datetime):
-                raise ValueError("Must be a date string or datetime")
-
-        elif field_schema.type == FieldType.SELECT:
-            if validation.values and value not in validation.values:
-                raise ValueError(f"Must be one of: {', '.join(validation.values)}")
-
-        elif field_schema.type == FieldType.RELATION:
-            if not isinstance(value, str):
-                raise ValueError("Must be a string (record ID)")
-
-        elif field_schema.type == FieldType.FILE:
-            if not isinstance(value, list):
-                raise ValueError("Must be an array of file IDs")
-
-        elif field_schema.type == FieldType.JSON:
-            # JSON accepts any structure
-            pass
-
-        return value
+        create, update = _get_adapters(self.collection_name, field_schemas)
+        adapter = create if is_create else update
+
+        try:
+            # Unknown fields are ignored; only provided fields are returned
+            return adapter.validate_python(data)
+        except ValidationError as e:
+            errors: Dict[Union[int, str], str] = {}
+            for error in e.errors():
+                message = _ERROR_MESSAGES.get(error["type"])
+                errors.setdefault(
+                    error["loc"][0],
+                    message(error.get("ctx", {})) if message else error["msg"],
+                )
+            raise ValidationException("Validation failed", details={"fields": errors}) from e
 
     def _to_response(self, record) -> RecordResponse:
         """Convert record model to response schema."""
-        # Extract data fields (exclude system fields)
-        data = {}
-        for key in dir(record):
-            if not key.startswith("_") and key not in ["id", "created", "updated", "metadata", "registry"]:
-                value = getattr(record, key)
-                # Skip SQLAlchemy internal attributes
-                if not callable(value) and not key.startswith("_sa_"):
-                    data[key] = value
-
-        return RecordResponse(
+        # Extract data fields (system fields are not part of the model's data columns)
+        data = {key: getattr(record, key) for key in record._data_columns}
+
+        # Row data is trusted, so skip re-validating the response
+        return RecordResponse.model_construct(
             id=record.id,
             data=data,
             created=record.created,
@@ -2,10 +2,11 @@
 Field type definitions and validators for dynamic collections.
 """
 
+import re
 from enum import Enum
 from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
 
 class FieldType(str, Enum):
@@ -37,6 +38,25 @@ class FieldValidation(BaseModel):
     pattern: Optional[str] = None  # Regex pattern
     values: Optional[List[Any]] = None  # Allowed values for select
 
+    # Compiled pattern, built once when the rules are parsed
+    _compiled_pattern: Optional[re.Pattern[str]] = PrivateAttr(default=None)
+
+    @field_validator("pattern")
+    @classmethod
+    def validate_pattern(cls, v: Optional[str]) -> Optional[str]:
+        """Reject patterns that are not valid regular expressions."""
+        if v is not None:
+            try:
+                re.compile(v)
+            except re.error as e:
+                raise ValueError(f"Invalid regex pattern: {e}") from e
+        return v
+
+    def model_post_init(self, __context: Any) -> None:
+        """Compile the pattern so record validation reuses it."""
+        if self.pattern:
+            self._compiled_pattern = re.compile(self.pattern)
+
 
 class RelationOptions(BaseModel):
     """Options for relation fields."""
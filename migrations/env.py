@@ -17,6 +17,7 @@ from app.db.base import Base
 
 # Import all models here to ensure they're registered with Base.metadata
 from app.db.models.collection import Collection
+from app.db.models.file import File
 from app.db.models.user import User, RefreshToken
 
 # Alembic Config object
@@ -33,6 +34,18 @@ target_metadata = Base.metadata
 config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
 
 
+def include_name(name, type_, parent_names) -> bool:
+    """
+    Limit autogenerate to tables defined in the application metadata.
+
+    Collection tables are created at runtime and are not managed by
+    migrations; filtering them by name skips reflecting each of them.
+    """
+    if type_ == "table":
+        return name in target_metadata.tables
+    return True
+
+
 def run_migrations_offline() -> None:
     """
     Run migrations in 'offline' mode.
@@ -65,6 +78,8 @@ def do_run_migrations(connection: Connection) -> None:
         target_metadata=target_metadata,
         compare_type=True,
         compare_server_default=True,
+        include_name=include_name,
+        include_schemas=False,
     )
 
     with context.begin_transaction():
@@ -93,8 +108,15 @@ def run_migrations_online() -> None:
     Run migrations in 'online' mode.
 
     In this scenario we need to create an Engine and associate a
-    connection with the context.
+    connection with the context. A programmatic caller (e.g. application
+    startup or a test harness) can instead pass an open connection from its
+    own pooled engine via ``config.attributes["connection"]``.
     """
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+        return
+
     asyncio.run(run_async_migrations())
 
 
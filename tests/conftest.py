@@ -0,0 +1,32 @@
+"""
+Shared test configuration.
+
+Settings are read at import time, so the environment is prepared before
+any application module is imported.
+"""
+
+import os
+
+os.environ.setdefault("SECRET_KEY", "test-secret-key-that-is-at-least-32-chars")
+os.environ.setdefault("ADMIN_PASSWORD", "test-admin-password")
+os.environ["ENVIRONMENT"] = "development"
+os.environ["DATABASE_URL"] = "sqlite+aiosqlite:///:memory:"
+
+import pytest  # noqa: E402
+
+from app.db.base import Base  # noqa: E402
+from app.db.models import collection, file, user  # noqa: E402,F401
+from app.db.session import AsyncSessionLocal, engine  # noqa: E402
+
+
+@pytest.fixture
+async def db():
+    """Provide a session on a fresh in-memory database."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSessionLocal() as session:
+        yield session
+
+    # Closing the shared in-memory connection discards the database
+    await engine.dispose()
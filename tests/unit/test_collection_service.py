@@ -0,0 +1,52 @@
+"""Tests for collection updates."""
+
+import pytest
+
+from app.db.models.dynamic import DynamicModelGenerator
+from app.schemas.collection import CollectionCreate, CollectionUpdate
+from app.services.collection_service import CollectionService, invalidate_schema_cache
+
+FIELDS = [{"name": "title", "type": "text"}]
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Reset per-process caches between tests."""
+    yield
+    DynamicModelGenerator.clear_cache()
+    invalidate_schema_cache()
+
+
+async def test_unchanged_schema_is_not_rewritten(db):
+    service = CollectionService(db)
+    created = await service.create_collection(CollectionCreate(name="posts", schema=FIELDS))
+    await service.get_field_schemas("posts")
+
+    updated = await service.update_collection(created.id, CollectionUpdate(schema=FIELDS))
+
+    assert updated.updated == created.updated
+    assert DynamicModelGenerator.get_model("posts") is not None
+
+
+async def test_changed_schema_is_written_and_evicts_caches(db):
+    service = CollectionService(db)
+    created = await service.create_collection(CollectionCreate(name="posts", schema=FIELDS))
+    await service.get_field_schemas("posts")
+
+    new_fields = FIELDS + [{"name": "views", "type": "number"}]
+    updated = await service.update_collection(created.id, CollectionUpdate(schema=new_fields))
+
+    assert [field.name for field in updated.schema] == ["title", "views"]
+    assert updated.updated != created.updated
+    assert DynamicModelGenerator.get_model("posts") is None
+
+
+async def test_rename_evicts_previous_name(db):
+    service = CollectionService(db)
+    created = await service.create_collection(CollectionCreate(name="posts", schema=FIELDS))
+    await service.get_field_schemas("posts")
+
+    updated = await service.update_collection(created.id, CollectionUpdate(name="articles"))
+
+    assert updated.name == "articles"
+    assert DynamicModelGenerator.get_model("posts") is None
@@ -0,0 +1,28 @@
+"""Tests for event serialization."""
+
+import json
+
+import orjson
+
+from app.core.events import Event, EventType
+
+
+def make_event():
+    event = Event(EventType.RECORD_CREATED, "posts", {"id": "abc"}, record_id="abc")
+    event.timestamp = 1760450263.25
+    return event
+
+
+def test_to_dict_is_json_safe():
+    data = json.loads(json.dumps(make_event().to_dict()))
+
+    assert data["type"] == "record.created"
+    assert data["timestamp"] == "2025-10-14T13:57:43.250000Z"
+
+
+def test_sse_frame_matches_to_dict():
+    event = make_event()
+    header, payload, *_ = event.to_sse_bytes().split(b"\n")
+
+    assert header == b"event: record.created"
+    assert orjson.loads(payload.removeprefix(b"data: ")) == json.loads(json.dumps(event.to_dict()))
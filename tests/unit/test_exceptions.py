@@ -0,0 +1,40 @@
+"""Tests for application exceptions and their API handler."""
+
+import inspect
+import types
+
+import orjson
+import pytest
+
+from app.core import exceptions
+from app.core.exceptions import FastCMSException, ValidationException
+from app.main import fastcms_exception_handler
+
+SUBCLASSES = [
+    cls
+    for _, cls in inspect.getmembers(exceptions, inspect.isclass)
+    if issubclass(cls, FastCMSException) and cls is not FastCMSException
+]
+
+
+def test_core_attributes_are_slots():
+    for name in ("message", "status_code", "details"):
+        assert isinstance(FastCMSException.__dict__[name], types.MemberDescriptorType)
+
+
+@pytest.mark.parametrize("cls", SUBCLASSES, ids=lambda cls: cls.__name__)
+def test_subclasses_declare_empty_slots(cls):
+    assert cls.__dict__.get("__slots__") == ()
+
+
+async def test_handler_serializes_details():
+    exc = ValidationException("Validation failed", details={"fields": {"title": "Required"}})
+    request = types.SimpleNamespace(url=types.SimpleNamespace(path="/api/v1/posts/records"))
+
+    response = await fastcms_exception_handler(request, exc)
+
+    assert response.status_code == 422
+    assert orjson.loads(response.body) == {
+        "error": "Validation failed",
+        "details": {"fields": {"title": "Required"}},
+    }
@@ -0,0 +1,51 @@
+"""Tests for field schema definitions."""
+
+import pytest
+from pydantic import ValidationError
+
+from app.core.exceptions import BadRequestException
+from app.db.models.collection import Collection
+from app.schemas.collection import CollectionCreate
+from app.services.collection_service import CollectionService, invalidate_schema_cache
+from app.utils.field_types import FieldSchema, FieldValidation
+
+
+def test_pattern_is_compiled_once_parsed():
+    validation = FieldValidation(pattern="^[A-Z]")
+
+    assert validation._compiled_pattern.match("Hello")
+    assert not validation._compiled_pattern.match("hello")
+
+
+def test_invalid_pattern_is_rejected():
+    with pytest.raises(ValidationError, match="Invalid regex pattern"):
+        FieldValidation(pattern="(")
+
+
+def test_collection_with_invalid_pattern_is_rejected():
+    with pytest.raises(ValidationError, match="Invalid regex pattern"):
+        CollectionCreate(
+            name="bad",
+            schema=[{"name": "title", "type": "text", "validation": {"pattern": "("}}],
+        )
+
+
+async def test_stored_invalid_pattern_is_a_bad_request(db):
+    # A row written before patterns were checked
+    db.add(
+        Collection(
+            name="legacy",
+            schema={"fields": [{"name": "title", "type": "text", "validation": {"pattern": "("}}]},
+        )
+    )
+    await db.commit()
+    invalidate_schema_cache()
+
+    with pytest.raises(BadRequestException, match="invalid schema"):
+        await CollectionService(db).get_field_schemas("legacy")
+
+
+def test_field_schema_without_pattern():
+    field = FieldSchema(name="title", type="text")
+
+    assert field.validation._compiled_pattern is None
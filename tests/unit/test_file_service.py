@@ -0,0 +1,33 @@
+"""Tests for FileService upload copying."""
+
+import io
+import tempfile
+
+from app.services.file_service import FileService, _is_in_memory
+
+
+def test_spooled_file_in_memory_until_rolled_over():
+    spooled = tempfile.SpooledTemporaryFile(max_size=10)
+    spooled.write(b"x" * 5)
+    assert _is_in_memory(spooled)
+
+    spooled.write(b"x" * 10)
+    assert not _is_in_memory(spooled)
+
+
+def test_plain_streams():
+    assert _is_in_memory(io.BytesIO(b"data"))
+    with tempfile.TemporaryFile() as f:
+        assert not _is_in_memory(f)
+
+
+async def test_write_file_copies_in_memory_and_disk_uploads(db, tmp_path):
+    service = FileService(db)
+    for name, max_size in (("memory.bin", 1024), ("disk.bin", 1)):
+        upload = tempfile.SpooledTemporaryFile(max_size=max_size)
+        upload.write(b"payload")
+        upload.seek(0)
+
+        service._write_file(upload, tmp_path / name)
+
+        assert (tmp_path / name).read_bytes() == b"payload"
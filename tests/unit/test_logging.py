@@ -0,0 +1,28 @@
+"""Tests for JSON log output."""
+
+import io
+import logging
+
+import orjson
+
+from app.core.logging import JSONFormatter, JSONStreamHandler
+
+
+def test_json_lines_follow_pending_text_output():
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(raw, encoding="utf-8")
+    handler = JSONStreamHandler(stream)
+    handler.setFormatter(JSONFormatter())
+    logger = logging.getLogger("tests.json_stream")
+    logger.addHandler(handler)
+    logger.propagate = False
+
+    try:
+        stream.write("plain text\n")
+        logger.warning("structured")
+    finally:
+        logger.removeHandler(handler)
+
+    text, line = raw.getvalue().splitlines()
+    assert text == b"plain text"
+    assert orjson.loads(line)["message"] == "structured"
@@ -0,0 +1,21 @@
+"""Tests for the SSE event stream."""
+
+import asyncio
+
+from app.api.v1.realtime import event_generator
+from app.core.events import Event, EventType, event_manager
+
+
+async def test_stream_yields_collection_events_and_unsubscribes_on_close():
+    stream = event_generator("posts")
+    assert b"event: connected" in await stream.__anext__()
+
+    event = Event(EventType.RECORD_CREATED, "posts", {"id": "abc"}, record_id="abc")
+    await event_manager.broadcast(event)
+    frame = await asyncio.wait_for(stream.__anext__(), timeout=5)
+    assert frame == event.to_sse_bytes()
+    assert event_manager.get_subscriber_count("posts") == 1
+
+    # StreamingResponse closes the generator when the client disconnects
+    await stream.aclose()
+    assert event_manager.get_subscriber_count("posts") == 0
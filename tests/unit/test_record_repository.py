@@ -0,0 +1,42 @@
+"""Tests for record access after a collection table disappears."""
+
+import pytest
+from sqlalchemy import text
+
+from app.core.exceptions import NotFoundException
+from app.db.models.dynamic import DynamicModelGenerator
+from app.db.repositories.record import RecordRepository
+from app.schemas.collection import CollectionCreate
+from app.services.collection_service import (
+    CollectionService,
+    _schema_cache,
+    invalidate_schema_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Reset per-process caches between tests."""
+    yield
+    DynamicModelGenerator.clear_cache()
+    invalidate_schema_cache()
+
+
+async def test_dropped_table_evicts_caches_and_is_not_found(db):
+    service = CollectionService(db)
+    await service.create_collection(
+        CollectionCreate(name="posts", schema=[{"name": "title", "type": "text"}])
+    )
+    await service.get_field_schemas("posts")
+
+    # Another worker dropped the table while this one still has it cached
+    await db.execute(text("DROP TABLE posts"))
+
+    with pytest.raises(NotFoundException):
+        await RecordRepository(db, "posts").get_page()
+
+    assert DynamicModelGenerator.get_model("posts") is None
+
+    # The next lookup drops the stale schema and re-reads the collection row
+    cached = _schema_cache["posts"][1]
+    assert await service.get_field_schemas("posts") is not cached
@@ -0,0 +1,73 @@
+"""Tests for record field validation."""
+
+import pytest
+
+from app.core.exceptions import ValidationException
+from app.services.record_service import RecordService
+from app.utils.field_types import FieldSchema, FieldValidation
+
+FIELD_SCHEMAS = [
+    FieldSchema(name="title", type="text"),
+    FieldSchema(name="author", type="relation"),
+    FieldSchema(name="score", type="number", validation=FieldValidation(min=10, max=20)),
+]
+
+
+def validation_errors(db, data):
+    service = RecordService(db, "posts")
+    with pytest.raises(ValidationException) as exc_info:
+        service._validate_fields(data, FIELD_SCHEMAS, is_create=True)
+    return exc_info.value.details["fields"]
+
+
+async def test_relation_must_be_a_record_id(db):
+    errors = validation_errors(db, {"title": "Hello", "author": 42})
+
+    assert errors == {"author": "Must be a string (record ID)"}
+
+
+async def test_text_type_message_is_unchanged(db):
+    errors = validation_errors(db, {"title": 42, "author": "abc"})
+
+    assert errors == {"title": "Must be a string"}
+
+
+async def test_relation_accepts_record_id(db):
+    service = RecordService(db, "posts")
+
+    data = service._validate_fields({"title": "Hello", "author": "abc"}, FIELD_SCHEMAS, is_create=True)
+
+    assert data == {"title": "Hello", "author": "abc"}
+
+
+@pytest.mark.parametrize(
+    ("score", "message"),
+    [
+        (25, "Maximum value is 20"),
+        (25.5, "Maximum value is 20"),
+        (5.5, "Minimum value is 10"),
+        ("15", "Must be a number"),
+    ],
+)
+async def test_number_errors(db, score, message):
+    errors = validation_errors(db, {"title": "Hello", "author": "abc", "score": score})
+
+    assert errors == {"score": message}
+
+
+@pytest.mark.parametrize("score", [10, 15.5, 20])
+async def test_number_within_bounds(db, score):
+    service = RecordService(db, "posts")
+
+    data = service._validate_fields({"score": score}, FIELD_SCHEMAS, is_create=False)
+
+    assert data == {"score": score}
+
+
+async def test_number_accepts_bool_like_any_int(db):
+    service = RecordService(db, "posts")
+    bounded = [FieldSchema(name="score", type="number", validation=FieldValidation(max=20))]
+
+    data = service._validate_fields({"score": True}, bounded, is_create=False)
+
+    assert data == {"score": True}
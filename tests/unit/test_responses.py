@@ -0,0 +1,91 @@
+"""Tests for service responses built with model_construct from ORM rows."""
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from app.db.models.dynamic import DynamicModelGenerator
+from app.db.repositories.file import FileRepository
+from app.db.repositories.record import RecordRepository
+from app.schemas.collection import CollectionCreate, CollectionResponse
+from app.schemas.file import FileResponse
+from app.schemas.record import RecordResponse
+from app.services.collection_service import CollectionService
+from app.services.file_service import FileService
+from app.services.record_service import RecordService
+from app.utils.field_types import FieldSchema
+
+FIELDS = [
+    {"name": "title", "type": "text", "validation": {"required": True, "pattern": "^[A-Z]"}},
+    {"name": "views", "type": "number"},
+]
+
+
+def assert_complete(response: BaseModel, model: type[BaseModel]) -> None:
+    """Check a constructed response has every required field and re-validates."""
+    assert isinstance(response, model)
+
+    missing = [
+        name
+        for name, field in model.model_fields.items()
+        if field.is_required() and name not in response.model_fields_set
+    ]
+    assert missing == []
+
+    dumped = response.model_dump()
+    assert model.model_validate(dumped).model_dump() == dumped
+
+
+async def test_collection_response(db):
+    response = await CollectionService(db).create_collection(
+        CollectionCreate(name="posts", schema=FIELDS)
+    )
+
+    assert_complete(response, CollectionResponse)
+    assert all(isinstance(field, FieldSchema) for field in response.schema)
+
+
+async def test_collection_response_rejects_unknown_stored_type(db):
+    service = CollectionService(db)
+    await service.create_collection(CollectionCreate(name="posts", schema=FIELDS))
+    collection = await service.repo.get_by_name("posts")
+    collection.type = "table"
+
+    with pytest.raises(ValidationError):
+        service._to_response(collection)
+
+
+async def test_file_response(db):
+    file = await FileRepository(db).create(
+        {
+            "filename": "a.png",
+            "original_filename": "a.png",
+            "mime_type": "image/png",
+            "size": 4,
+            "storage_path": "2024/01/01/a.png",
+            "storage_type": "local",
+        }
+    )
+
+    response = FileService(db)._to_response(file)
+
+    assert_complete(response, FileResponse)
+    assert response.url == f"/api/v1/files/{file.id}/download"
+
+
+async def test_record_response(db):
+    fields = [FieldSchema(**field) for field in FIELDS]
+    model = DynamicModelGenerator.create_model(collection_name="articles", fields=fields)
+    await DynamicModelGenerator.create_table(await db.connection(), model)
+
+    record = await RecordRepository(db, "articles").create({"title": "Hello"})
+    response = RecordService(db, "articles")._to_response(record)
+
+    assert_complete(response, RecordResponse)
+    assert response.data == {"title": "Hello", "views": None}
+
+
+@pytest.fixture(autouse=True)
+def clear_models():
+    """Drop dynamic models registered by a test."""
+    yield
+    DynamicModelGenerator.clear_cache()